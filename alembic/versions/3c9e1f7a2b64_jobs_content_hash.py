@@ -0,0 +1,30 @@
+"""jobs content hash
+
+Revision ID: 3c9e1f7a2b64
+Revises: 7dbf45914a4f
+Create Date: 2026-10-18 11:02:17.530941
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e1f7a2b64'
+down_revision: Union[str, Sequence[str], None] = '7dbf45914a4f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nullable with no backfill: existing rows get their hash the next time
+    # they're ingested (NULL IS DISTINCT FROM any hash, so that one write happens).
+    op.add_column('jobs', sa.Column('content_hash', sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('jobs', 'content_hash')
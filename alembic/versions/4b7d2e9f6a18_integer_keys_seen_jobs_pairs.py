@@ -0,0 +1,128 @@
+"""integer keys, seen_jobs as (search_id, job_id) pairs
+
+Revision ID: 4b7d2e9f6a18
+Revises: e17b3a5c9d40
+Create Date: 2026-10-18 20:31:47.015526
+
+Online migration: no table rewrites and no long exclusive locks.
+  - jobs.id / saved_searches.id: added nullable, defaulted from a sequence so
+    new rows get ids straight away, backfilled in small committed batches,
+    uniquely indexed CONCURRENTLY, made NOT NULL via a validated CHECK (no
+    scan under the exclusive lock), then switched to an identity column.
+  - seen_jobs: the narrow table is built next to the old one and backfilled in
+    batches by old id; a short write lock covers the catch-up and the swap.
+Needs a live database (batches read row counts), so no --sql mode.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7d2e9f6a18'
+down_revision: Union[str, Sequence[str], None] = 'e17b3a5c9d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH = 10000
+
+
+def _add_bigint_key(table: str, key: str) -> None:
+    op.add_column(table, sa.Column('id', sa.BigInteger(), nullable=True))
+    op.execute(f"CREATE SEQUENCE {table}_id_seq AS bigint OWNED BY {table}.id")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')")
+
+    conn = op.get_bind()
+    with op.get_context().autocommit_block():
+        while conn.execute(sa.text(
+            f"UPDATE {table} SET id = nextval('{table}_id_seq') "
+            f"WHERE {key} IN (SELECT {key} FROM {table} WHERE id IS NULL LIMIT {BATCH})"
+        )).rowcount:
+            pass
+        op.execute(f"CREATE UNIQUE INDEX CONCURRENTLY ix_{table}_id ON {table} (id)")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_id_not_null "
+                   "CHECK (id IS NOT NULL) NOT VALID")
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {table}_id_not_null")
+
+    # the validated CHECK lets SET NOT NULL skip its table scan
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET NOT NULL")
+    op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_id_not_null")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+    op.execute(f"DROP SEQUENCE {table}_id_seq")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY")
+    op.execute(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+               f"coalesce(max(id), 0) + 1, false) FROM {table}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _add_bigint_key('jobs', 'uid')
+    _add_bigint_key('saved_searches', 'name')
+
+    op.create_table('seen_jobs_new',
+    sa.Column('search_id', sa.BigInteger(), nullable=False),
+    sa.Column('job_id', sa.BigInteger(), nullable=False),
+    sa.Column('seen_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('search_id', 'job_id', name='pk_seen_jobs_new')
+    )
+
+    copy_sql = (
+        "INSERT INTO seen_jobs_new (search_id, job_id, seen_at) "
+        "SELECT s.id, j.id, o.seen_at FROM seen_jobs o "
+        "JOIN saved_searches s ON s.name = o.search_name "
+        "JOIN jobs j ON j.uid = o.job_uid "
+        "WHERE o.id > :lo AND o.id <= :hi "
+        "ON CONFLICT DO NOTHING"
+    )
+    conn = op.get_bind()
+    with op.get_context().autocommit_block():
+        copied_to = conn.execute(sa.text("SELECT coalesce(max(id), 0) FROM seen_jobs")).scalar_one()
+        for lo in range(0, copied_to, BATCH):
+            conn.execute(sa.text(copy_sql), {"lo": lo, "hi": min(lo + BATCH, copied_to)})
+
+    # swap: block writers only for the catch-up of rows added meanwhile
+    op.execute("LOCK TABLE seen_jobs IN SHARE ROW EXCLUSIVE MODE")
+    conn.execute(sa.text(copy_sql), {"lo": copied_to, "hi": 2 ** 62})
+    op.drop_table('seen_jobs')
+    op.rename_table('seen_jobs_new', 'seen_jobs')
+    op.execute("ALTER TABLE seen_jobs RENAME CONSTRAINT pk_seen_jobs_new TO pk_seen_jobs")
+    op.execute("ALTER TABLE seen_jobs ADD CONSTRAINT seen_jobs_search_id_fkey "
+               "FOREIGN KEY (search_id) REFERENCES saved_searches (id) NOT VALID")
+    op.execute("ALTER TABLE seen_jobs ADD CONSTRAINT seen_jobs_job_id_fkey "
+               "FOREIGN KEY (job_id) REFERENCES jobs (id) NOT VALID")
+
+    with op.get_context().autocommit_block():
+        # checks existing rows without blocking writes
+        op.execute("ALTER TABLE seen_jobs VALIDATE CONSTRAINT seen_jobs_search_id_fkey")
+        op.execute("ALTER TABLE seen_jobs VALIDATE CONSTRAINT seen_jobs_job_id_fkey")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # offline-style: rebuilds the string-keyed table in one transaction
+    op.rename_table('seen_jobs', 'seen_jobs_pairs')
+    op.create_table('seen_jobs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('search_name', sa.String(), nullable=False),
+    sa.Column('job_uid', sa.String(), nullable=False),
+    sa.Column('seen_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['job_uid'], ['jobs.uid'], ),
+    sa.ForeignKeyConstraint(['search_name'], ['saved_searches.name'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('search_name', 'job_uid', name='uq_seen_search_job')
+    )
+    op.create_index(op.f('ix_seen_jobs_job_uid'), 'seen_jobs', ['job_uid'], unique=False)
+    op.create_index(op.f('ix_seen_jobs_search_name'), 'seen_jobs', ['search_name'], unique=False)
+    op.execute(
+        "INSERT INTO seen_jobs (search_name, job_uid, seen_at) "
+        "SELECT s.name, j.uid, p.seen_at FROM seen_jobs_pairs p "
+        "JOIN saved_searches s ON s.id = p.search_id "
+        "JOIN jobs j ON j.id = p.job_id"
+    )
+    op.drop_table('seen_jobs_pairs')
+
+    op.drop_index('ix_saved_searches_id', table_name='saved_searches')
+    op.drop_column('saved_searches', 'id')
+    op.drop_index('ix_jobs_id', table_name='jobs')
+    op.drop_column('jobs', 'id')
@@ -0,0 +1,35 @@
+"""jobs trigram indexes
+
+Revision ID: 5e2b8d1c7f03
+Revises: a41d6c0e9b27
+Create Date: 2026-10-18 13:41:52.660417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2b8d1c7f03'
+down_revision: Union[str, Sequence[str], None] = 'a41d6c0e9b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm ships with Postgres contrib and is a trusted extension (13+)
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for col in ('title', 'company', 'location'):
+        op.create_index(f'ix_jobs_{col}_trgm', 'jobs',
+                        [sa.text(f'lower({col}) gin_trgm_ops')],
+                        unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for col in ('title', 'company', 'location'):
+        op.drop_index(f'ix_jobs_{col}_trgm', table_name='jobs', postgresql_using='gin')
+    # the extension is left installed; other objects may depend on it
@@ -0,0 +1,36 @@
+"""ingest watermarks
+
+Revision ID: 7dbf45914a4f
+Revises: b001b59147a5
+Create Date: 2026-10-18 09:12:41.204118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7dbf45914a4f'
+down_revision: Union[str, Sequence[str], None] = 'b001b59147a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ingest_watermarks',
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('query_key', sa.String(), nullable=False),
+    sa.Column('newest_posted_at', sa.DateTime(), nullable=True),
+    sa.Column('newest_uids', postgresql.ARRAY(sa.String()), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('source', 'query_key')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('ingest_watermarks')
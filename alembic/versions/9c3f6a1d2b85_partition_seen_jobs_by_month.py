@@ -0,0 +1,121 @@
+"""partition seen_jobs by month on seen_at
+
+Revision ID: 9c3f6a1d2b85
+Revises: 4b7d2e9f6a18
+Create Date: 2026-10-18 21:12:05.402113
+
+Online, like 4b7d2e9f6a18: the partitioned table is built next to the old
+one (a temporary seen_at index, built CONCURRENTLY, drives the month-by-month
+copy), then a short write lock covers the catch-up and the swap.
+Partitions are created from the oldest seen_at month to 3 months ahead;
+afterwards POST /tasks/maintenance/seen-jobs keeps them coming and prunes.
+Needs a live database (reads the seen_at range), so no --sql mode.
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3f6a1d2b85'
+down_revision: Union[str, Sequence[str], None] = '4b7d2e9f6a18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AHEAD = 3
+
+
+def _add_months(month: date, n: int) -> date:
+    y, m = divmod(month.month - 1 + n, 12)
+    return date(month.year + y, m + 1, 1)
+
+
+def _month(d: datetime) -> date:
+    return date(d.year, d.month, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_seen_jobs_seen_at_tmp "
+                   "ON seen_jobs (seen_at)")
+
+    op.create_table('seen_jobs_new',
+    sa.Column('search_id', sa.BigInteger(), nullable=False),
+    sa.Column('job_id', sa.BigInteger(), nullable=False),
+    sa.Column('seen_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], name='seen_jobs_job_id_fkey'),
+    sa.ForeignKeyConstraint(['search_id'], ['saved_searches.id'], name='seen_jobs_search_id_fkey'),
+    sa.PrimaryKeyConstraint('search_id', 'job_id', 'seen_at', name='pk_seen_jobs_new'),
+    postgresql_partition_by='RANGE (seen_at)'
+    )
+
+    oldest, newest, now = conn.execute(sa.text(
+        "SELECT min(seen_at), max(seen_at), now() AT TIME ZONE 'utc' FROM seen_jobs"
+    )).one()
+    first = _month(oldest or now)
+    last = max(_add_months(_month(now), AHEAD), _month(newest or now))
+    month = first
+    while month <= last:
+        nxt = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE seen_jobs_p{month.year:04d}{month.month:02d} "
+            f"PARTITION OF seen_jobs_new "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{nxt.isoformat()}')"
+        )
+        month = nxt
+
+    copy_sql = (
+        "INSERT INTO seen_jobs_new (search_id, job_id, seen_at) "
+        "SELECT search_id, job_id, seen_at FROM seen_jobs "
+        "WHERE seen_at >= :lo AND seen_at < :hi "
+        "ON CONFLICT DO NOTHING"
+    )
+    if newest is not None:
+        with op.get_context().autocommit_block():
+            month = first
+            while month <= _month(newest):
+                nxt = _add_months(month, 1)
+                conn.execute(sa.text(copy_sql), {"lo": month, "hi": nxt})
+                month = nxt
+
+    # swap: block writers only while rows added during the copy catch up
+    # (seen_at comes from app clocks, hence the margin)
+    op.execute("LOCK TABLE seen_jobs IN SHARE ROW EXCLUSIVE MODE")
+    if newest is not None:
+        conn.execute(sa.text(
+            "INSERT INTO seen_jobs_new (search_id, job_id, seen_at) "
+            "SELECT search_id, job_id, seen_at FROM seen_jobs "
+            "WHERE seen_at > CAST(:since AS timestamp) - interval '1 hour' "
+            "ON CONFLICT DO NOTHING"
+        ), {"since": newest})
+    else:
+        op.execute("INSERT INTO seen_jobs_new SELECT search_id, job_id, seen_at FROM seen_jobs")
+    op.drop_table('seen_jobs')
+    op.rename_table('seen_jobs_new', 'seen_jobs')
+    op.execute("ALTER TABLE seen_jobs RENAME CONSTRAINT pk_seen_jobs_new TO pk_seen_jobs")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # offline-style: back to one plain table in one transaction; detached
+    # partitions are left alone
+    op.rename_table('seen_jobs', 'seen_jobs_parts')
+    op.execute("ALTER TABLE seen_jobs_parts RENAME CONSTRAINT pk_seen_jobs TO pk_seen_jobs_parts")
+    op.create_table('seen_jobs',
+    sa.Column('search_id', sa.BigInteger(), nullable=False),
+    sa.Column('job_id', sa.BigInteger(), nullable=False),
+    sa.Column('seen_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], name='seen_jobs_job_id_fkey'),
+    sa.ForeignKeyConstraint(['search_id'], ['saved_searches.id'], name='seen_jobs_search_id_fkey'),
+    sa.PrimaryKeyConstraint('search_id', 'job_id', name='pk_seen_jobs')
+    )
+    op.execute(
+        "INSERT INTO seen_jobs (search_id, job_id, seen_at) "
+        "SELECT search_id, job_id, min(seen_at) FROM seen_jobs_parts "
+        "GROUP BY search_id, job_id"
+    )
+    op.drop_table('seen_jobs_parts')
@@ -0,0 +1,32 @@
+"""jobs feed order index
+
+Revision ID: c82f4a9d1e56
+Revises: 5e2b8d1c7f03
+Create Date: 2026-10-18 14:55:09.873214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c82f4a9d1e56'
+down_revision: Union[str, Sequence[str], None] = '5e2b8d1c7f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_jobs_feed_order', 'jobs', [
+        sa.text('posted_at DESC NULLS LAST'),
+        sa.text('created_at DESC'),
+        sa.text('uid DESC'),
+    ], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_feed_order', table_name='jobs')
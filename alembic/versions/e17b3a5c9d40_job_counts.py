@@ -0,0 +1,37 @@
+"""job counts
+
+Revision ID: e17b3a5c9d40
+Revises: c82f4a9d1e56
+Create Date: 2026-10-18 16:08:33.402157
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e17b3a5c9d40'
+down_revision: Union[str, Sequence[str], None] = 'c82f4a9d1e56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_counts',
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('job_count', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('source')
+    )
+    # seed from the existing rows (one scan, here instead of on every request)
+    op.execute(
+        "INSERT INTO job_counts (source, job_count) "
+        "SELECT source, count(*) FROM jobs GROUP BY source"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('job_counts')
@@ -2,6 +2,12 @@ from fastapi import Request
 from app.mailer.base import Mailer
 from app.sources.reed import ReedApiClient
 from app.sources.adzuna import AdzunaApiClient
+from app.services.fanout import SourcePools
+from app.sources.cache import ResponseCache
+from app.db_replica import replica_usable, replica_usable_async, write_lsn
+from typing import AsyncIterator, Dict, Optional
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -17,6 +23,30 @@ def get_adzuna_client(request: Request) -> AdzunaApiClient:
     return request.app.state.adzuna
 
 
+def get_response_cache(request: Request) -> Optional[ResponseCache]:
+    return request.app.state.response_cache
+
+
+def get_source_pools(request: Request) -> SourcePools:
+    return request.app.state.source_pools
+
+
+def get_engines(request: Request) -> Dict[str, Engine]:
+    state = request.app.state
+    engines = {
+        "sync": state.engine,
+        "async": state.async_engine.sync_engine,
+    }
+    if state.read_engine is not None:
+        engines["read"] = state.read_engine
+        engines["async_read"] = state.async_read_engine.sync_engine
+    return engines
+
+
+def get_replica_lag(request: Request):
+    return request.app.state.replica_lag
+
+
 def get_db(request: Request):
     SessionLocal = request.app.state.db
     db: Session = SessionLocal()
@@ -24,3 +54,47 @@ def get_db(request: Request):
         yield db
     finally:
         db.close()
+
+
+async def get_async_db(request: Request) -> AsyncIterator[AsyncSession]:
+    # for `async def` routes: awaits the DB instead of holding a threadpool worker
+    AsyncSessionLocal = request.app.state.async_db
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_read_db(request: Request):
+    """
+    Session for pure-read routes: the read replica when one is configured,
+    isn't lagging past READ_REPLICA_MAX_LAG_SECONDS and has replayed this
+    client's last write (see app.db_replica); otherwise the primary.
+    """
+    state = request.app.state
+    if state.read_engine is None:
+        yield from get_db(request)
+        return
+
+    db: Session = state.read_db()
+    try:
+        to_replica = replica_usable(db, state.replica_lag, write_lsn(request))
+        state.replica_lag.routed(to_replica)
+        if not to_replica:
+            db.close()
+            db = state.db()
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request) -> AsyncIterator[AsyncSession]:
+    state = request.app.state
+    factory = state.async_db
+    if state.read_engine is not None:
+        async with state.async_read_db() as replica:
+            to_replica = await replica_usable_async(replica, state.replica_lag, write_lsn(request))
+            state.replica_lag.routed(to_replica)
+            if to_replica:
+                yield replica
+                return
+    async with factory() as db:
+        yield db
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from operator import attrgetter
+from typing import Any, Dict
+
+from fastapi import Response
+
+from app.api.schemas import JobOut
+
+# Optional fast encoder; without it the stdlib produces the same JSON.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# JobOut's fields, in order. Anything with these attributes can be rendered:
+# a Job, a JobRow or a column-tuple Row from job_repo_db.
+JOB_FIELDS = tuple(JobOut.model_fields)
+_job_values = attrgetter(*JOB_FIELDS)
+
+
+def job_dict(j) -> Dict[str, Any]:
+    """The JobOut shape as a plain dict (one allocation, no validation)."""
+    return dict(zip(JOB_FIELDS, _job_values(j)))
+
+
+def _default(o: Any) -> str:
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()  # same text as orjson/pydantic for naive values
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(
+        payload, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_response(payload: Any) -> Response:
+    """
+    Pre-serialized JSON response.
+
+    WHY: returning a Response skips FastAPI's response_model validation and
+    encoding, which for job lists meant a JobOut model plus jsonable_encoder
+    dicts per row. The route keeps its response_model for the OpenAPI docs;
+    job_dict keeps the payload in that shape.
+    """
+    return Response(content=dumps(payload), media_type="application/json")
@@ -14,6 +14,12 @@ class JobOut(BaseModel):
     posted_at: Optional[datetime] = None
 
 
+class JobPageOut(BaseModel):
+    items: List[JobOut]
+    # opaque; pass back as ?cursor= for the next page (None on the last page)
+    next_cursor: Optional[str] = None
+
+
 class DebugAddJobIn(BaseModel):
     title: str
     company: Optional[str] = None
@@ -21,14 +27,24 @@ class DebugAddJobIn(BaseModel):
 
 class IngestOut(BaseModel):
     fetched: int
-    affected: int
+    affected: int  # inserted + updated
     total_in_store: int
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0  # already stored with identical content (not rewritten)
 
 
 class ReedIngestIn(BaseModel):
     keywords: str
     location_name: Optional[str] = None
     results_to_take: int = 25
+    # > 1 pages through results (backfill); stop_on_known ends at the first
+    # page whose jobs are all already stored (incremental poll)
+    max_pages: int = 1
+    stop_on_known: bool = False
+    # backfill: stream every page into job_repo_db.bulk_load (COPY + one
+    # set-based merge per BULK_LOAD_CHUNK_ROWS) instead of upserting per page
+    bulk: bool = False
 
 
 class AdzunaIngestIn(BaseModel):
@@ -36,6 +52,9 @@ class AdzunaIngestIn(BaseModel):
     where: Optional[str] = None
     results_per_page: int = 20
     page: int = 1
+    max_pages: int = 1
+    stop_on_known: bool = False
+    bulk: bool = False  # see ReedIngestIn.bulk
 
 
 class IngestAllIn(BaseModel):
@@ -11,6 +11,31 @@ class Settings(BaseSettings):
     ADZUNA_APP_ID: str
     ADZUNA_APP_KEY: str
     DATABASE_URL: str
+    # async engine (AsyncSession routes); default: DATABASE_URL on psycopg 3
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # optional read replica for the pure-read routes (deps.get_read_db);
+    # unset: everything reads from DATABASE_URL
+    READ_DATABASE_URL: Optional[str] = None
+    ASYNC_READ_DATABASE_URL: Optional[str] = None
+    # reads go to the primary while the replica lags more than this
+    READ_REPLICA_MAX_LAG_SECONDS: float = 10
+    READ_REPLICA_LAG_CHECK_SECONDS: float = 5
+    # how long after a write a client keeps checking the replica has it
+    # (read-your-writes cookie lifetime)
+    READ_YOUR_WRITES_SECONDS: int = 300
+
+    # connection pool (per engine; the sync and async engines each get one)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds; -1 keeps connections forever
+    # ping on every checkout (one extra round trip); with a recycle shorter than
+    # the server/pooler idle timeout it can usually be turned off
+    DB_POOL_PRE_PING: bool = True
+    # behind a transaction-mode pooler (PgBouncer, Supabase :6543): no
+    # server-side prepared statements
+    DB_PGBOUNCER: bool = False
 
     # cron security
     CRON_SECRET: str
@@ -26,6 +51,62 @@ class Settings(BaseSettings):
     POSTMARK_SERVER_TOKEN: Optional[str] = None
     POSTMARK_MESSAGE_STREAM: str = "notification"
 
+    # source fan-out: max in-flight upstream calls per provider (tasks runner)
+    REED_MAX_CONCURRENCY: int = 4
+    ADZUNA_MAX_CONCURRENCY: int = 4
+
+    # upstream response cache: "memory", "disk" (survives restarts) or "none"
+    SOURCE_CACHE_BACKEND: str = "memory"
+    SOURCE_CACHE_TTL_SECONDS: int = 300
+    SOURCE_CACHE_MAX_ENTRIES: int = 512
+    SOURCE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    SOURCE_CACHE_PATH: str = str(
+        Path(__file__).resolve().parents[2] / ".cache" / "source_responses.sqlite3")
+
+    # upstream pacing, matched to each provider's quota
+    # (Adzuna default plan: 25 hits/minute; Reed doesn't publish one, keep it polite)
+    REED_RATE_PER_MINUTE: float = 60
+    REED_RATE_BURST: int = 5
+    ADZUNA_RATE_PER_MINUTE: float = 25
+    ADZUNA_RATE_BURST: int = 5
+
+    # retries (429/5xx/timeouts) and circuit breaker, shared by all sources
+    SOURCE_RETRY_ATTEMPTS: int = 4
+    SOURCE_RETRY_BASE_SECONDS: float = 0.5
+    SOURCE_RETRY_MAX_SECONDS: float = 30
+    SOURCE_BREAKER_FAILURES: int = 5
+    SOURCE_BREAKER_COOLOFF_SECONDS: float = 60
+
+    # offline harness for source HTTP: "live", "record" (save responses as
+    # cassettes) or "replay" (serve cassettes with injected latency/errors)
+    SOURCE_HTTP_MODE: str = "live"
+    SOURCE_CASSETTE_DIR: str = str(
+        Path(__file__).resolve().parents[2] / ".cassettes")
+    REPLAY_LATENCY_MS: float = 0  # < 0 replays the recorded latency
+    REPLAY_JITTER_MS: float = 0
+    REPLAY_ERROR_RATE: float = 0.0
+    REPLAY_MATCH: str = "path"  # "exact" or "path"
+
+    # /jobs/search + saved searches: "tokens" (every word a case-insensitive
+    # substring, served by the trigram indexes) or "fts" (tsvector + GIN:
+    # stemmed whole words, so "node" no longer finds "Node.js"). Opt-in: the
+    # in-memory matchers (planner fan-out, percolator) only do "tokens".
+    SEARCH_MODE: str = "tokens"
+
+    # how /tasks runs find new jobs for saved searches: "search" (re-run each
+    # search, report its unseen top `limit`) or "percolate" (match only the
+    # jobs the run inserted against all searches at once; jobs loaded through
+    # /ingest/* are never reported in this mode)
+    NEW_JOBS_MODE: str = "search"
+
+    # seen_jobs retention: monthly partitions whose whole range is older than
+    # this are dropped (or only detached, for archiving) by POST
+    # /tasks/maintenance/seen-jobs. Jobs stored longer ago than this are never
+    # reported as new, since their seen rows may already be gone.
+    SEEN_RETENTION_DAYS: int = 180  # 0 keeps everything
+    SEEN_RETENTION_ACTION: str = "drop"  # "drop" or "detach"
+    SEEN_PARTITIONS_AHEAD: int = 3  # future months created in advance
+
     # pydantic-settings v2: load from a local .env file for dev convenience
     model_config = {
         "env_file": str(Path(__file__).resolve().parents[2] / ".env"),
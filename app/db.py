@@ -1,4 +1,8 @@
+from typing import Any, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 
@@ -6,8 +10,9 @@ class Base(DeclarativeBase):
     pass
 
 
-def make_engine(database_url: str):
-    return create_engine(database_url, pool_pre_ping=True)
+def make_engine(database_url: str, **options: Any) -> Engine:
+    # options: pool sizing and driver args, see app.db_pool.engine_options
+    return create_engine(database_url, **{"pool_pre_ping": True, **options})
 
 
 def make_session_factory(engine):
@@ -16,3 +21,33 @@ def make_session_factory(engine):
         autoflush=False,
         expire_on_commit=False,
     )
+
+
+# Drivers with an asyncio flavour; anything else (psycopg2, bare postgresql://)
+# is served by psycopg 3, which speaks both.
+ASYNC_DRIVERS = {"psycopg", "asyncpg"}
+
+
+def async_database_url(database_url: str, override: Optional[str] = None) -> str:
+    """
+    URL for the async engine: `override` if set, else DATABASE_URL with its
+    driver switched to psycopg (3) when it isn't async-capable already.
+    """
+    url = make_url(override or database_url)
+    if url.get_driver_name() not in ASYNC_DRIVERS:
+        url = url.set(drivername=f"{url.get_backend_name()}+psycopg")
+    return url.render_as_string(hide_password=False)
+
+
+def make_async_engine(database_url: str, **options: Any) -> AsyncEngine:
+    return create_async_engine(database_url, **{"pool_pre_ping": True, **options})
+
+
+def make_async_session_factory(engine: AsyncEngine):
+    # expire_on_commit=False matters more here: a lazy refresh would need an
+    # await that attribute access can't do
+    return async_sessionmaker(
+        bind=engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
@@ -1,13 +1,19 @@
 from datetime import datetime, date
-from typing import Optional
-from sqlalchemy import String, DateTime, Date, Integer, ForeignKey, UniqueConstraint
+from typing import List, Optional
+from sqlalchemy import BigInteger, Computed, Identity, PrimaryKeyConstraint, String, text, DateTime, Date, Index, Integer, ForeignKey
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db import Base
 
+# Text search config baked into jobs.search_vector; queries must use the same one.
+TS_CONFIG = "english"
+
 
 class JobRow(Base):
     __tablename__ = "jobs"
     uid: Mapped[str] = mapped_column(String, primary_key=True)
+    # compact internal key for references (seen_jobs); the API only exposes uid
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), nullable=False)
     source: Mapped[str] = mapped_column(String, index=True)
     source_job_id: Mapped[str] = mapped_column(String, index=True)
 
@@ -21,11 +27,57 @@ class JobRow(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow)
 
+    # hash of the ingested fields (job_repo_db.content_hash); upserts skip
+    # rows whose hash is unchanged instead of rewriting them
+    content_hash: Mapped[Optional[str]] = mapped_column(
+        String(32), nullable=True)
+
+    # full-text document, weighted title (A) > company (B) > location (C).
+    # Generated by Postgres, so every write path keeps it current; deferred so
+    # ORM loads of JobRow don't drag it along.
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{TS_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{TS_CONFIG}', coalesce(company, '')), 'B') || "
+            f"setweight(to_tsvector('{TS_CONFIG}', coalesce(location, '')), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
+    __table_args__ = (
+        Index("ix_jobs_id", "id", unique=True),
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        # keyset pagination: same columns/directions as job_repo_db.FEED_ORDER
+        Index("ix_jobs_feed_order", text("posted_at DESC NULLS LAST"),
+              text("created_at DESC"), text("uid DESC")),
+        # pg_trgm: serve lower(col) LIKE '%x%' and fuzzy (%>) matches
+        Index("ix_jobs_title_trgm", text("lower(title) gin_trgm_ops"),
+              postgresql_using="gin"),
+        Index("ix_jobs_company_trgm", text("lower(company) gin_trgm_ops"),
+              postgresql_using="gin"),
+        Index("ix_jobs_location_trgm", text("lower(location) gin_trgm_ops"),
+              postgresql_using="gin"),
+    )
+
+
+class JobCountRow(Base):
+    """
+    Number of jobs per source, kept in step with inserts by job_repo_db's
+    upserts (same transaction), so totals don't need a count(*) scan.
+    """
+    __tablename__ = "job_counts"
+
+    source: Mapped[str] = mapped_column(String, primary_key=True)
+    job_count: Mapped[int] = mapped_column(BigInteger, default=0)
+
 
 class SavedSearchRow(Base):
     __tablename__ = "saved_searches"
 
     name: Mapped[str] = mapped_column(String, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), nullable=False)
     q: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     source: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     location: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -35,18 +87,51 @@ class SavedSearchRow(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_saved_searches_id", "id", unique=True),
+    )
+
 
 class SeenJobRow(Base):
+    """
+    (search, job) pairs already reported. Two bigints instead of two strings
+    plus a surrogate id: this table grows as searches x jobs, so row and
+    index width is what matters. The primary key doubles as the
+    "seen by this search" lookup index.
+
+    Range-partitioned by month on seen_at (seen_jobs_pYYYYMM, managed by
+    seen_partitions_db) so retention drops whole partitions instead of
+    DELETEing rows. Postgres needs the partition key in the primary key, so
+    (search_id, job_id) is no longer unique by itself: writers take
+    saved_search_repo_db.lock_search_stmt first and skip pairs already seen.
+    """
     __tablename__ = "seen_jobs"
 
-    id: Mapped[int] = mapped_column(
-        Integer, primary_key=True, autoincrement=True)
-    search_name: Mapped[str] = mapped_column(
-        ForeignKey("saved_searches.name"), index=True)
-    job_uid: Mapped[str] = mapped_column(ForeignKey("jobs.uid"), index=True)
+    search_id: Mapped[int] = mapped_column(
+        ForeignKey("saved_searches.id"))
+    job_id: Mapped[int] = mapped_column(ForeignKey("jobs.id"))
     seen_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow)
 
     __table_args__ = (
-        UniqueConstraint("search_name", "job_uid", name="uq_seen_search_job"),
+        PrimaryKeyConstraint("search_id", "job_id", "seen_at", name="pk_seen_jobs"),
+        {"postgresql_partition_by": "RANGE (seen_at)"},
     )
+
+
+class IngestWatermarkRow(Base):
+    """
+    Newest posting already ingested per (source, normalized upstream query).
+    newest_uids are the uids seen AT newest_posted_at, so postings sharing that
+    timestamp (Reed dates are day-granular) aren't dropped or re-ingested.
+    """
+    __tablename__ = "ingest_watermarks"
+
+    source: Mapped[str] = mapped_column(String, primary_key=True)
+    query_key: Mapped[str] = mapped_column(String, primary_key=True)
+    newest_posted_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True)
+    newest_uids: Mapped[List[str]] = mapped_column(
+        ARRAY(String), default=list)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow)
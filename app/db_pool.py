@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.config import settings
+
+
+class PoolMetrics:
+    """
+    Checkout latency for one engine's pool: how long callers waited for a
+    connection (queueing when the pool is exhausted, plus pre-ping/connect),
+    and how many gave up after DB_POOL_TIMEOUT.
+    Percentiles cover the most recent `window` checkouts.
+    """
+
+    def __init__(self, window: int = 1024) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._recent: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, *, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            self._recent.append(seconds)
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        with self._lock:
+            recent = sorted(self._recent)
+            out: Dict[str, Any] = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.max_wait * 1000, 3),
+            }
+        for p in (50, 95, 99):
+            out[f"wait_ms_p{p}"] = (
+                round(recent[min(len(recent) - 1, len(recent) * p // 100)] * 1000, 3)
+                if recent else 0.0
+            )
+        if isinstance(pool, QueuePool):
+            out.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+            })
+        return out
+
+
+def metered(poolclass: type, metrics: PoolMetrics) -> type:
+    """
+    Subclass of poolclass that times every checkout into metrics. A class
+    (not an instance attribute) so it survives Pool.recreate() on dispose.
+    """
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            conn = poolclass.connect(self)
+        except exc.TimeoutError:
+            metrics.observe(time.perf_counter() - start, timed_out=True)
+            raise
+        metrics.observe(time.perf_counter() - start)
+        return conn
+
+    return type(f"Metered{poolclass.__name__}", (poolclass,), {
+        "connect": connect,
+        "metrics": metrics,
+    })
+
+
+def engine_options(database_url: str, *, is_async: bool = False) -> Dict[str, Any]:
+    """
+    make_engine/make_async_engine options from Settings (DB_POOL_*,
+    DB_PGBOUNCER), with a metered pool (see pool_stats). The sync and async
+    engines each get their own pool: budget DB_POOL_SIZE + DB_MAX_OVERFLOW
+    connections for each.
+
+    DB_PGBOUNCER: transaction-mode poolers (PgBouncer, Supabase's pooler) hand
+    each transaction to any server connection, so server-side prepared
+    statements created on one may be missing on the next. Turn them off in
+    the drivers that make them (psycopg 3 auto-prepares repeated queries,
+    asyncpg caches them); psycopg2 never does.
+
+    The async engine never auto-prepares on psycopg 3, DB_PGBOUNCER or not:
+    it's derived from DATABASE_URL (see db.async_database_url), which may
+    well point at a pooler that was only ever used through psycopg2.
+    """
+    connect_args: Dict[str, Any] = {}
+    driver = make_url(database_url).get_driver_name()
+    if is_async and driver == "psycopg":
+        connect_args["prepare_threshold"] = None
+    if settings.DB_PGBOUNCER:
+        if driver == "psycopg":
+            connect_args["prepare_threshold"] = None
+        elif driver == "asyncpg":
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+
+    poolclass = AsyncAdaptedQueuePool if is_async else QueuePool
+    return {
+        "poolclass": metered(poolclass, PoolMetrics()),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    pool = engine.pool
+    metrics: Optional[PoolMetrics] = getattr(pool, "metrics", None)
+    if metrics is None:
+        return {"status": pool.status()}
+    return metrics.snapshot(pool)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+# Read-replica routing (READ_DATABASE_URL): pure-read routes use the replica
+# unless it lags too far behind overall, or behind this client's last write.
+# Writes are remembered as the primary's WAL position in a cookie; a replica
+# that has replayed past it already shows the client its own writes.
+
+WRITE_LSN_COOKIE = "jc_write_lsn"
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+_LSN = re.compile(r"^[0-9A-Fa-f]{1,8}/[0-9A-Fa-f]{1,8}$")
+
+PRIMARY_LSN_SQL = text("SELECT pg_current_wal_lsn()::text")
+# replay lsn is NULL on a server that isn't a standby (e.g. a dev setup with
+# READ_DATABASE_URL pointing at the primary): always caught up
+CAUGHT_UP_SQL = text(
+    "SELECT coalesce(pg_last_wal_replay_lsn() >= CAST(:lsn AS pg_lsn), true)")
+# pg_last_xact_replay_timestamp() stops moving when the primary is idle, so
+# a standby that has replayed everything it received counts as current
+LAG_SQL = text(
+    "SELECT CASE"
+    " WHEN pg_last_wal_replay_lsn() IS NULL THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END")
+
+
+class ReplicaLag:
+    """
+    The replica's last measured lag, re-measured at most every check_seconds
+    (so routing costs one extra query per interval, not per request), plus
+    how many reads went where. An unreachable replica counts as unhealthy
+    until the next check.
+    """
+
+    def __init__(self, max_lag_seconds: float, check_seconds: float) -> None:
+        self.max_lag_seconds = max_lag_seconds
+        self.check_seconds = check_seconds
+        self.lag_seconds: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self._lock = threading.Lock()
+
+    def stale(self) -> bool:
+        return self.checked_at is None or time.monotonic() - self.checked_at >= self.check_seconds
+
+    def record(self, lag_seconds: Optional[float]) -> None:
+        with self._lock:
+            self.lag_seconds = None if lag_seconds is None else float(lag_seconds)
+            self.checked_at = time.monotonic()
+
+    def healthy(self) -> bool:
+        lag = self.lag_seconds
+        return lag is not None and lag <= self.max_lag_seconds
+
+    def routed(self, to_replica: bool) -> None:
+        with self._lock:
+            if to_replica:
+                self.replica_reads += 1
+            else:
+                self.primary_reads += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "lag_seconds": self.lag_seconds,
+                "max_lag_seconds": self.max_lag_seconds,
+                "healthy": self.healthy(),
+                "replica_reads": self.replica_reads,
+                "primary_reads": self.primary_reads,
+            }
+
+
+def write_lsn(request: Request) -> Optional[str]:
+    lsn = request.cookies.get(WRITE_LSN_COOKIE)
+    return lsn if lsn and _LSN.match(lsn) else None
+
+
+def replica_usable(db: Session, lag: ReplicaLag, lsn: Optional[str]) -> bool:
+    """True when `db` (a replica session) may serve this request's reads."""
+    try:
+        if lag.stale():
+            lag.record(db.execute(LAG_SQL).scalar_one())
+        if not lag.healthy():
+            return False
+        return lsn is None or bool(db.execute(CAUGHT_UP_SQL, {"lsn": lsn}).scalar_one())
+    except exc.SQLAlchemyError:  # driver errors, but also pool checkout timeouts
+        lag.record(None)
+        return False
+
+
+async def replica_usable_async(db: AsyncSession, lag: ReplicaLag, lsn: Optional[str]) -> bool:
+    try:
+        if lag.stale():
+            lag.record((await db.execute(LAG_SQL)).scalar_one())
+        if not lag.healthy():
+            return False
+        return lsn is None or bool((await db.execute(CAUGHT_UP_SQL, {"lsn": lsn})).scalar_one())
+    except exc.SQLAlchemyError:
+        lag.record(None)
+        return False
+
+
+async def remember_write_lsn(request: Request, call_next):
+    """
+    HTTP middleware: after a successful non-GET request, set the write cookie
+    to the primary's current WAL position (at or past that request's commits).
+    Only with a replica configured; otherwise every read is on the primary.
+    """
+    response = await call_next(request)
+    state = request.app.state
+    if (
+        getattr(state, "read_engine", None) is not None
+        and request.method not in READ_METHODS
+        and response.status_code < 400
+    ):
+        async with state.async_engine.connect() as conn:
+            lsn = (await conn.execute(PRIMARY_LSN_SQL)).scalar_one()
+        response.set_cookie(
+            WRITE_LSN_COOKIE, lsn,
+            max_age=settings.READ_YOUR_WRITES_SECONDS, httponly=True, samesite="lax")
+    return response
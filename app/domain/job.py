@@ -1,47 +1,173 @@
-from dataclasses import dataclass
-from typing import Optional
+import sys
+from dataclasses import FrozenInstanceError
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 from datetime import datetime
 
 
-@dataclass(frozen=True)
 class Job:
     """
     WHY this exists:
       - This is our INTERNAL representation of a job.
       - No matter where a job comes from (Reed, Adzuna, Visa, etc.),
         we normalize it into this shape.
+
+    Immutable and slotted (no per-instance __dict__), with `uid` computed once:
+    backfills hold tens of thousands of these, and uid is read in every
+    dedupe/seen-set path. Hand-written rather than @dataclass(slots=True)
+    because we still run on Python 3.9.
     """
+    __slots__ = ("source", "source_job_id", "title", "company",
+                 "location", "url", "posted_at", "uid")
+
     source: str
     source_job_id: str
     title: str
-    company: Optional[str] = None
-    location: Optional[str] = None
-    url: Optional[str] = None
-    posted_at: Optional[datetime] = None
+    company: Optional[str]
+    location: Optional[str]
+    url: Optional[str]
+    posted_at: Optional[datetime]
+    # Stable unique key for dedupe. Example: reed:123456
+    uid: str
+
+    def __init__(
+        self,
+        source: str,
+        source_job_id: str,
+        title: str,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        url: Optional[str] = None,
+        posted_at: Optional[datetime] = None,
+    ) -> None:
+        # a handful of distinct sources: share one string object per source
+        source = sys.intern(source)
+        init = object.__setattr__
+        init(self, "source", source)
+        init(self, "source_job_id", source_job_id)
+        init(self, "title", title)
+        init(self, "company", company)
+        init(self, "location", location)
+        init(self, "url", url)
+        init(self, "posted_at", posted_at)
+        init(self, "uid", f"{source}:{source_job_id}")
+
+    def _fields(self) -> Tuple:
+        return (self.source, self.source_job_id, self.title, self.company,
+                self.location, self.url, self.posted_at)
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        return (
+            f"Job(source={self.source!r}, source_job_id={self.source_job_id!r}, "
+            f"title={self.title!r}, company={self.company!r}, location={self.location!r}, "
+            f"url={self.url!r}, posted_at={self.posted_at!r})"
+        )
+
+    def __reduce__(self):
+        # default slot pickling would go through the frozen __setattr__
+        return (Job, self._fields())
+
+
+class JobBatch:
+    """
+    Many jobs stored column-wise (one list per field) instead of one object each.
+
+    WHY: during a backfill the ingest/matching paths hold lots of postings at once;
+    parallel lists cost one pointer per field per job, with no per-job object
+    header. Iterating yields Job objects on demand.
+    """
+    __slots__ = ("source", "source_job_id", "title", "company",
+                 "location", "url", "posted_at", "uid")
+
+    def __init__(self, jobs: Iterable[Job] = ()) -> None:
+        for name in self.__slots__:
+            setattr(self, name, [])
+        self.extend(jobs)
+
+    def append(self, job: Job) -> None:
+        self.source.append(job.source)
+        self.source_job_id.append(job.source_job_id)
+        self.title.append(job.title)
+        self.company.append(job.company)
+        self.location.append(job.location)
+        self.url.append(job.url)
+        self.posted_at.append(job.posted_at)
+        self.uid.append(job.uid)
+
+    def extend(self, jobs: Iterable[Job]) -> None:
+        for job in jobs:
+            self.append(job)
+
+    def __len__(self) -> int:
+        return len(self.uid)
+
+    def __getitem__(self, i: int) -> Job:
+        return Job(self.source[i], self.source_job_id[i], self.title[i], self.company[i],
+                   self.location[i], self.url[i], self.posted_at[i])
+
+    def __iter__(self) -> Iterator[Job]:
+        return map(Job, self.source, self.source_job_id, self.title, self.company,
+                   self.location, self.url, self.posted_at)
 
-    @property
-    def uid(self) -> str:
-        """
-        WHY: Stable unique key for dedupe.
-        Example: reed:123456
-        """
-        return f"{self.source}:{self.source_job_id}"
+    def rows(self) -> Iterator[Dict]:
+        """Column-wise -> dicts shaped like JobRow, without building Job objects."""
+        for uid, source, sid, title, company, location, url, posted_at in zip(
+            self.uid, self.source, self.source_job_id, self.title,
+            self.company, self.location, self.url, self.posted_at,
+        ):
+            yield {
+                "uid": uid,
+                "source": source,
+                "source_job_id": sid,
+                "title": title,
+                "company": company,
+                "location": location,
+                "url": url,
+                "posted_at": posted_at,
+            }
 
 
 # Helper date parsers (Reed is DD/MM/YYYY, Adzuna is ISO)
+# WHY hand-rolled + cached: strptime is slow, both formats are fixed-width, and
+# a page of results shares a handful of distinct dates. datetimes are immutable,
+# so handing out the same cached instance is safe.
+@lru_cache(maxsize=4096)
 def parse_reed_date(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
     try:
+        if len(value) == 10 and value[2] == "/" and value[5] == "/":
+            return datetime(int(value[6:10]), int(value[3:5]), int(value[0:2]))
         return datetime.strptime(value, "%d/%m/%Y")
     except ValueError:
         return None
 
 
+@lru_cache(maxsize=4096)
 def parse_adzuna_date_iso(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
     try:
+        if (len(value) == 20 and value[4] == "-" and value[7] == "-" and value[10] == "T"
+                and value[13] == ":" and value[16] == ":" and value[19] == "Z"):
+            return datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            )
         return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
     except ValueError:
         return None
@@ -1,38 +1,94 @@
 from contextlib import asynccontextmanager
 
-from sqlalchemy import text
-from app.db import make_engine, make_session_factory
+from sqlalchemy import exc, text
+from app.db import (
+    async_database_url,
+    make_async_engine,
+    make_async_session_factory,
+    make_engine,
+    make_session_factory,
+)
+from app.db_pool import engine_options
+from app.db_replica import ReplicaLag, remember_write_lsn
 import httpx
 from fastapi import FastAPI
 
 from app.core.config import settings
 from app.mailer import make_mailer
+from app.services.fanout import SourcePools
 from app.sources.reed import ReedApiClient
 from app.sources.adzuna import AdzunaApiClient
+from app.sources.cache import make_response_cache
+from app.sources.resilience import make_source_resilience
+from app.sources.replay import make_source_transport
 from app.routers import debug, jobs, health, ingest, searches, tasks, ui
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Initialize db connection, engine, clients, repo.
-    engine = make_engine(settings.DATABASE_URL)
+    engine = make_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
     app.state.engine = engine
     app.state.db = make_session_factory(engine)
 
     with engine.connect() as conn:
         conn.execute(text("select 1"))
 
+    # seen_jobs has no default partition: make sure this month's (and the
+    # next few) exist even if the maintenance cron hasn't run lately. Best
+    # effort: every /tasks run retries before it writes seen_jobs
+    with app.state.db() as db:
+        try:
+            tasks.ensure_seen_partitions(db)
+        except exc.SQLAlchemyError:
+            db.rollback()
+
+    # async engine for routes that have moved to AsyncSession (see deps.get_async_db);
+    # connects lazily, so sync-only deployments pay nothing for it
+    async_url = async_database_url(settings.DATABASE_URL, settings.ASYNC_DATABASE_URL)
+    async_engine = make_async_engine(async_url, **engine_options(async_url, is_async=True))
+    app.state.async_engine = async_engine
+    app.state.async_db = make_async_session_factory(async_engine)
+
+    # optional read replica (deps.get_read_db / get_async_read_db); without one
+    # the read factories are the primary's
+    app.state.read_engine = app.state.async_read_engine = None
+    app.state.read_db, app.state.async_read_db = app.state.db, app.state.async_db
+    app.state.replica_lag = None
+    if settings.READ_DATABASE_URL:
+        read_url = settings.READ_DATABASE_URL
+        app.state.read_engine = make_engine(read_url, **engine_options(read_url))
+        app.state.read_db = make_session_factory(app.state.read_engine)
+        async_read_url = async_database_url(read_url, settings.ASYNC_READ_DATABASE_URL)
+        app.state.async_read_engine = make_async_engine(
+            async_read_url, **engine_options(async_read_url, is_async=True))
+        app.state.async_read_db = make_async_session_factory(app.state.async_read_engine)
+        app.state.replica_lag = ReplicaLag(
+            settings.READ_REPLICA_MAX_LAG_SECONDS, settings.READ_REPLICA_LAG_CHECK_SECONDS)
+
     app.state.mailer = make_mailer()
 
-    # shared HTTP clients
+    # shared HTTP clients (transport is swapped for record/replay, see SOURCE_HTTP_MODE)
     reed_http = httpx.Client(auth=(settings.REED_API_KEY, ""), timeout=30, headers={
-                             "Accept": "application/json"})
+                             "Accept": "application/json"}, transport=make_source_transport())
     adzuna_http = httpx.Client(
-        timeout=30, headers={"Accept": "application/json"})
+        timeout=30, headers={"Accept": "application/json"}, transport=make_source_transport())
+
+    # one response cache shared by all sources (keys are source-prefixed)
+    app.state.response_cache = make_response_cache()
 
-    app.state.reed = ReedApiClient(settings.REED_API_KEY, client=reed_http)
+    app.state.reed = ReedApiClient(
+        settings.REED_API_KEY, client=reed_http, cache=app.state.response_cache,
+        **make_source_resilience("reed"))
     app.state.adzuna = AdzunaApiClient(
-        settings.ADZUNA_APP_ID, settings.ADZUNA_APP_KEY, client=adzuna_http)
+        settings.ADZUNA_APP_ID, settings.ADZUNA_APP_KEY, client=adzuna_http,
+        cache=app.state.response_cache, **make_source_resilience("adzuna"))
+
+    # bounded worker pools so /tasks/* can call sources concurrently
+    app.state.source_pools = SourcePools({
+        "reed": settings.REED_MAX_CONCURRENCY,
+        "adzuna": settings.ADZUNA_MAX_CONCURRENCY,
+    })
 
     try:
         yield
@@ -41,12 +97,21 @@ async def lifespan(app: FastAPI):
             app.state.mailer.close()
         except Exception:
             pass
+        app.state.source_pools.shutdown()
         reed_http.close()
         adzuna_http.close()
+        if app.state.response_cache is not None:
+            app.state.response_cache.close()
+        if app.state.read_engine is not None:
+            await app.state.async_read_engine.dispose()
+            app.state.read_engine.dispose()
+        await async_engine.dispose()
         engine.dispose()
 
 
 app = FastAPI(title="Job Collector (Learning Version)", lifespan=lifespan)
+# read-your-writes cookie for replica routing (no-op without READ_DATABASE_URL)
+app.middleware("http")(remember_write_lsn)
 
 app.include_router(health.router)
 app.include_router(jobs.router)
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends
-from app.api.deps import get_reed_client, get_adzuna_client
+from app.api.deps import get_reed_client, get_adzuna_client, get_response_cache, get_engines, get_replica_lag
+from app.db_pool import pool_stats
 from app.sources.reed import ReedApiClient
 from app.sources.adzuna import AdzunaApiClient
 
@@ -35,3 +36,26 @@ def debug_adzuna_raw(
         page=page,
         country="gb",
     )
+
+
+@router.get("/cache")
+def debug_cache_stats(cache=Depends(get_response_cache)):
+    # hit/miss/eviction counters for tuning SOURCE_CACHE_* settings
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+@router.get("/pool")
+def debug_pool_stats(engines=Depends(get_engines)):
+    # checkout waits (p50/p95/p99, timeouts) and in-use connections per engine;
+    # waits climbing toward DB_POOL_TIMEOUT mean the pool is undersized
+    return {name: pool_stats(engine) for name, engine in engines.items()}
+
+
+@router.get("/replica")
+def debug_replica(lag=Depends(get_replica_lag)):
+    # last measured lag and how many reads each side served
+    if lag is None:
+        return {"enabled": False}
+    return {"enabled": True, **lag.snapshot()}
@@ -6,24 +6,72 @@ from app.sources.reed import ReedApiClient
 
 from app.services import job_repo_db
 from sqlalchemy.orm import Session
+from typing import Iterable, Iterator, List, Tuple
+from app.domain.job import Job
 
 router = APIRouter(tags=["ingest"])
 
 
+def known_uids_checker(db: Session):
+    return lambda uids: job_repo_db.existing_uids(db, uids)
+
+
+def upsert_pages(db: Session, pages: Iterable[List[Job]]) -> Tuple[int, job_repo_db.UpsertCounts]:
+    # upsert page by page so memory stays bounded by one page
+    fetched = 0
+    counts = job_repo_db.UpsertCounts()
+    for jobs in pages:
+        fetched += len(jobs)
+        counts.add(job_repo_db.upsert_counts(db, jobs))
+    return fetched, counts
+
+
+def bulk_load_pages(db: Session, pages: Iterable[List[Job]]) -> Tuple[int, job_repo_db.UpsertCounts]:
+    # backfill: pages stream straight into bulk_load's COPY chunks, so memory
+    # stays bounded by one chunk however many pages there are
+    fetched = 0
+
+    def jobs() -> Iterator[Job]:
+        nonlocal fetched
+        for page in pages:
+            fetched += len(page)
+            yield from page
+
+    counts = job_repo_db.bulk_load(db, jobs())
+    return fetched, counts
+
+
+def load_pages(db: Session, pages: Iterable[List[Job]], bulk: bool) -> Tuple[int, job_repo_db.UpsertCounts]:
+    return bulk_load_pages(db, pages) if bulk else upsert_pages(db, pages)
+
+
+def ingest_out(fetched: int, counts: job_repo_db.UpsertCounts, total: int) -> IngestOut:
+    return IngestOut(
+        fetched=fetched,
+        affected=counts.affected,
+        total_in_store=total,
+        inserted=counts.inserted,
+        updated=counts.updated,
+        skipped=counts.unchanged,
+    )
+
+
 @router.post("/ingest/reed", response_model=IngestOut)
 def ingest_reed(
     payload: ReedIngestIn,
     db: Session = Depends(get_db),
     reed: ReedApiClient = Depends(get_reed_client),
 ):
-    jobs = reed.search(
+    pages = reed.iter_pages(
         keywords=payload.keywords,
         location_name=payload.location_name,
-        results_to_take=payload.results_to_take,
+        page_size=payload.results_to_take,
+        max_pages=payload.max_pages,
+        known_uids=known_uids_checker(db) if payload.stop_on_known else None,
     )
-    affected = job_repo_db.upsert_many(db, jobs)
+    fetched, counts = load_pages(db, pages, payload.bulk)
     total = job_repo_db.count_jobs(db)
-    return IngestOut(fetched=len(jobs), affected=affected, total_in_store=total)
+    return ingest_out(fetched, counts, total)
 
 
 @router.post("/ingest/adzuna", response_model=IngestOut)
@@ -32,15 +80,17 @@ def ingest_adzuna(
     db: Session = Depends(get_db),
     adzuna: AdzunaApiClient = Depends(get_adzuna_client),
 ):
-    jobs = adzuna.search(
+    pages = adzuna.iter_pages(
         what=payload.what,
         where=payload.where,
-        results_per_page=payload.results_per_page,
-        page=payload.page,
+        page_size=payload.results_per_page,
+        start_page=payload.page,
+        max_pages=payload.max_pages,
+        known_uids=known_uids_checker(db) if payload.stop_on_known else None,
     )
-    affected = job_repo_db.upsert_many(db, jobs)
+    fetched, counts = load_pages(db, pages, payload.bulk)
     total = job_repo_db.count_jobs(db)
-    return IngestOut(fetched=len(jobs), affected=affected, total_in_store=total)
+    return ingest_out(fetched, counts, total)
 
 
 @router.post("/ingest/all", response_model=IngestAllOut)
@@ -55,7 +105,7 @@ def ingest_all(
         location_name=payload.location_name,
         results_to_take=payload.reed_results,
     )
-    reed_affected = job_repo_db.upsert_many(db, reed_jobs)
+    reed_counts = job_repo_db.upsert_counts(db, reed_jobs)
 
     adzuna_jobs = adzuna.search(
         what=payload.keywords,
@@ -63,14 +113,12 @@ def ingest_all(
         results_per_page=payload.adzuna_results,
         page=payload.adzuna_page,
     )
-    adzuna_affected = job_repo_db.upsert_many(db, adzuna_jobs)
+    adzuna_counts = job_repo_db.upsert_counts(db, adzuna_jobs)
 
     total = job_repo_db.count_jobs(db)
 
     return IngestAllOut(
-        reed=IngestOut(fetched=len(reed_jobs),
-                       affected=reed_affected, total_in_store=total),
-        adzuna=IngestOut(fetched=len(adzuna_jobs),
-                         affected=adzuna_affected, total_in_store=total),
+        reed=ingest_out(len(reed_jobs), reed_counts, total),
+        adzuna=ingest_out(len(adzuna_jobs), adzuna_counts, total),
         total_in_store=total,
     )
@@ -1,53 +1,56 @@
 from datetime import date
-from typing import List, Optional
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 
-from app.api.deps import get_db
-from app.api.schemas import JobOut
-from app.services import job_repo_db
-from sqlalchemy.orm import Session
+from app.api.deps import get_async_read_db
+from app.api.job_json import job_dict, json_response
+from app.api.schemas import JobPageOut
+from app.services import job_repo_async
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(tags=["jobs"])
 
 
-def to_job_out(j) -> JobOut:
-    return JobOut(
-        uid=j.uid,
-        source=j.source,
-        source_job_id=j.source_job_id,
-        title=j.title,
-        company=j.company,
-        location=j.location,
-        url=j.url,
-        posted_at=j.posted_at,
-    )
-
-
-@router.get("/jobs", response_model=List[JobOut])
-def list_jobs(
+@router.get("/jobs", response_model=JobPageOut)
+async def list_jobs(
     limit: int = 50,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    jobs = job_repo_db.list_jobs(db, limit=limit)
-    return [to_job_out(j) for j in jobs]
+    try:
+        rows, next_cursor = await job_repo_async.list_jobs_page(db, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response({"items": [job_dict(r) for r in rows], "next_cursor": next_cursor})
 
 
-@router.get("/jobs/search", response_model=List[JobOut])
-def search_jobs(
+@router.get("/jobs/search", response_model=JobPageOut)
+async def search_jobs(
     q: Optional[str] = None,
     source: Optional[str] = None,
     location: Optional[str] = None,
     posted_after: Optional[date] = None,
     limit: int = 50,
-    db: Session = Depends(get_db),
+    mode: Optional[Literal["fts", "tokens"]] = None,  # default: settings.SEARCH_MODE
+    rank: bool = False,  # fts only: best matches first instead of newest first
+    fuzzy: bool = False,  # location: typo-tolerant trigram match instead of substring
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    jobs = job_repo_db.search_jobs(
-        db,
-        q=q,
-        source=source,
-        location=location,
-        posted_after=posted_after,
-        limit=limit,
-    )
-    return [to_job_out(j) for j in jobs]
+    try:
+        rows, next_cursor = await job_repo_async.search_jobs_page(
+            db,
+            q=q,
+            source=source,
+            location=location,
+            posted_after=posted_after,
+            limit=limit,
+            mode=mode,
+            rank=rank,
+            fuzzy=fuzzy,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response({"items": [job_dict(r) for r in rows], "next_cursor": next_cursor})
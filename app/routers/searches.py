@@ -3,32 +3,19 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_read_db
+from app.api.job_json import job_dict, json_response
 from app.api.schemas import (
     SavedSearchIn,
     SavedSearchOut,
     RunSavedSearchOut,
     NewJobsOut,
-    JobOut,
 )
 from app.services import saved_search_repo_db, job_repo_db
 
 router = APIRouter(prefix="/searches", tags=["searches"])
 
 
-def to_job_out(j) -> JobOut:
-    return JobOut(
-        uid=j.uid,
-        source=j.source,
-        source_job_id=j.source_job_id,
-        title=j.title,
-        company=j.company,
-        location=j.location,
-        url=j.url,
-        posted_at=j.posted_at,
-    )
-
-
 def to_saved_out(row, seen_count: int) -> SavedSearchOut:
     return SavedSearchOut(
         name=row.name,
@@ -61,13 +48,14 @@ def upsert_search(
 
 
 @router.get("", response_model=List[SavedSearchOut])
-def list_searches(db: Session = Depends(get_db)):
+def list_searches(db: Session = Depends(get_read_db)):
     rows = saved_search_repo_db.list_saved_searches(db)
-    return [to_saved_out(r, saved_search_repo_db.count_seen(db, r.name)) for r in rows]
+    seen = saved_search_repo_db.count_seen_many(db, [r.name for r in rows])
+    return [to_saved_out(r, seen[r.name]) for r in rows]
 
 
 @router.get("/{name}", response_model=SavedSearchOut)
-def get_search(name: str, db: Session = Depends(get_db)):
+def get_search(name: str, db: Session = Depends(get_read_db)):
     row = saved_search_repo_db.get_saved_search(db, name)
     if not row:
         raise HTTPException(status_code=404, detail="Saved search not found")
@@ -75,12 +63,12 @@ def get_search(name: str, db: Session = Depends(get_db)):
 
 
 @router.get("/{name}/run", response_model=RunSavedSearchOut)
-def run_search(name: str, db: Session = Depends(get_db)):
+def run_search(name: str, db: Session = Depends(get_read_db)):
     row = saved_search_repo_db.get_saved_search(db, name)
     if not row:
         raise HTTPException(status_code=404, detail="Saved search not found")
 
-    results = job_repo_db.search_jobs(
+    results, _ = job_repo_db.search_jobs_page(
         db,
         q=row.q,
         source=row.source,
@@ -89,10 +77,10 @@ def run_search(name: str, db: Session = Depends(get_db)):
         limit=row.limit,
     )
 
-    return RunSavedSearchOut(
-        search=to_saved_out(row, saved_search_repo_db.count_seen(db, name)),
-        results=[to_job_out(j) for j in results],
-    )
+    return json_response({
+        "search": to_saved_out(row, saved_search_repo_db.count_seen(db, name)).model_dump(),
+        "results": [job_dict(r) for r in results],
+    })
 
 
 @router.get("/{name}/new", response_model=NewJobsOut)
@@ -105,6 +93,6 @@ def new_jobs(name: str, db: Session = Depends(get_db)):
 
     return NewJobsOut(
         search=to_saved_out(row, seen_count),
-        new_jobs=[to_job_out(j) for j in new_items],
+        new_jobs=[job_dict(j) for j in new_items],
         new_count=len(new_items),
     )
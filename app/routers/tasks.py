@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db, get_reed_client, get_adzuna_client, get_mailer
+from app.api.deps import get_db, get_reed_client, get_adzuna_client, get_mailer, get_source_pools
 from app.api.tasks_deps import require_cron_secret
-from app.services import saved_search_repo_db, job_repo_db
+from app.core.config import settings
+from app.services import saved_search_repo_db, query_planner, seen_partitions_db, task_runner
+from app.services.percolator import Percolator
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -19,6 +21,32 @@ def format_email(search_name: str, new_items) -> str:
     return "\n".join(lines)
 
 
+NEW_JOBS_MODES = ("search", "percolate")
+
+
+def percolating() -> bool:
+    if settings.NEW_JOBS_MODE not in NEW_JOBS_MODES:
+        raise RuntimeError(f"Unknown NEW_JOBS_MODE={settings.NEW_JOBS_MODE}")
+    return settings.NEW_JOBS_MODE == "percolate"
+
+
+def ensure_seen_partitions(db: Session) -> None:
+    # runs are what write seen_jobs; a missed maintenance cron must not leave
+    # them without a partition for this month (one catalog query when present).
+    # Also run at startup, see main.lifespan
+    seen_partitions_db.ensure_partitions(db, ahead=settings.SEEN_PARTITIONS_AHEAD)
+
+
+def notify(mailer, search_name: str, new_items) -> bool:
+    if not new_items:
+        return False
+    mailer.send(
+        subject=f"[JobCollector] {len(new_items)} new jobs for {search_name}",
+        text=format_email(search_name, new_items),
+    )
+    return True
+
+
 @router.post("/searches/{name}/run", dependencies=[Depends(require_cron_secret)])
 def run_one_saved_search(
     name: str,
@@ -26,36 +54,53 @@ def run_one_saved_search(
     reed=Depends(get_reed_client),
     adzuna=Depends(get_adzuna_client),
     mailer=Depends(get_mailer),
+    pools=Depends(get_source_pools),
 ):
     s = saved_search_repo_db.get_saved_search(db, name)
     if not s:
         raise HTTPException(status_code=404, detail="Saved search not found")
 
-    q = s.q or ""
-    loc = s.location or None
-
-    reed_jobs = reed.search(keywords=q, location_name=loc, results_to_take=25)
-    adzuna_jobs = adzuna.search(what=q, where=loc, results_per_page=20, page=1)
-
-    job_repo_db.upsert_many(db, reed_jobs)
-    job_repo_db.upsert_many(db, adzuna_jobs)
-
-    _, new_items = saved_search_repo_db.new_jobs_for_search(db, name)
-
-    emailed = False
-    if new_items:
-        mailer.send(
-            subject=f"[JobCollector] {len(new_items)} new jobs for {name}",
-            text=format_email(name, new_items),
-        )
-        emailed = True
-
-    return {
+    percolate = percolating()
+    ensure_seen_partitions(db)
+    planned = query_planner.PlannedQuery(
+        query=query_planner.upstream_query_for(s), searches=[s])
+    watermarks = task_runner.load_watermarks(db, [planned.query])
+
+    # sources in parallel; wall-clock = slowest of them
+    futures = task_runner.submit_fetches(
+        pools, reed, adzuna, planned, watermarks)
+    fetched, errors = task_runner.collect(futures)
+    inserted_ids = {} if percolate else None
+    ingested = task_runner.ingest_fetched(
+        db, planned, fetched, watermarks, inserted_ids)
+
+    also_notified = {}
+    if percolate:
+        # the new jobs may match other searches too; they're told as well,
+        # since percolate mode only ever reports jobs as they're inserted
+        found = task_runner.percolate_new_jobs(
+            db, Percolator(saved_search_repo_db.list_saved_searches(db)),
+            (j for jobs in ingested.values() for j in jobs), inserted_ids)
+        new_items = found.pop(name, [])
+        also_notified = {
+            other: len(items) for other, items in found.items() if notify(mailer, other, items)
+        }
+    else:
+        _, new_items = saved_search_repo_db.new_jobs_for_search(db, name, search=s)
+
+    emailed = notify(mailer, name, new_items)
+
+    out = {
         "search": name,
-        "ingested": {"reed": len(reed_jobs), "adzuna": len(adzuna_jobs)},
+        "fetched": {source: len(jobs) for source, jobs in fetched.items()},
+        "ingested": {source: len(jobs) for source, jobs in ingested.items()},
         "new_count": len(new_items),
         "emailed": emailed,
+        "errors": errors,
     }
+    if percolate:
+        out["also_notified"] = also_notified
+    return out
 
 
 @router.post("/run-all", dependencies=[Depends(require_cron_secret)])
@@ -64,40 +109,81 @@ def run_all_saved_searches(
     reed=Depends(get_reed_client),
     adzuna=Depends(get_adzuna_client),
     mailer=Depends(get_mailer),
+    pools=Depends(get_source_pools),
 ):
+    percolate = percolating()
+    ensure_seen_partitions(db)
     searches = saved_search_repo_db.list_saved_searches(db)
+    plan = query_planner.plan_queries(searches)
+    # one index of every search for the whole run (percolate mode)
+    percolator = Percolator(searches) if percolate else None
+    watermarks = task_runner.load_watermarks(db, [p.query for p in plan])
     out = []
 
-    for s in searches:
-        q = s.q or ""
-        loc = s.location or None
-
-        reed_jobs = reed.search(
-            keywords=q, location_name=loc, results_to_take=25)
-        adzuna_jobs = adzuna.search(
-            what=q, where=loc, results_per_page=20, page=1)
-
-        job_repo_db.upsert_many(db, reed_jobs)
-        job_repo_db.upsert_many(db, adzuna_jobs)
-
-        _, new_items = saved_search_repo_db.new_jobs_for_search(db, s.name)
-
-        emailed = False
-        if new_items:
-            mailer.send(
-                subject=f"[JobCollector] {len(new_items)} new jobs for {s.name}",
-                text=format_email(s.name, new_items),
-            )
-            emailed = True
-
-        out.append({
-            "name": s.name,
-            "ingested": {"reed": len(reed_jobs), "adzuna": len(adzuna_jobs)},
-            "new_count": len(new_items),
-            "emailed": emailed,
-        })
-
-    return {"ran": len(out), "results": out}
+    # Phase 1: submit one upstream call per distinct query (not per search).
+    # The per-source pools bound how many run at once, so wall-clock tracks
+    # the slowest calls, not the number of searches.
+    pending = [
+        (planned, task_runner.submit_fetches(
+            pools, reed, adzuna, planned, watermarks))
+        for planned in plan
+    ]
+
+    # Phase 2: DB + email work stays on this thread (a Session is not thread-safe).
+    inserted_ids = {}
+    inserted_jobs = []
+    for planned, futures in pending:
+        fetched, errors = task_runner.collect(futures)
+        ingested = task_runner.ingest_fetched(
+            db, planned, fetched, watermarks, inserted_ids if percolate else None)
+        if percolate:
+            inserted_jobs.extend(j for jobs in ingested.values() for j in jobs)
+
+        # fan the shared results back out to every search in the group
+        if percolate:
+            matched = {source: percolator.percolate(jobs) for source, jobs in ingested.items()}
+        for s in planned.searches:
+            new_items = []
+            if not percolate:
+                _, new_items = saved_search_repo_db.new_jobs_for_search(
+                    db, s.name, search=s)
+
+            out.append({
+                "name": s.name,
+                "ingested": {
+                    source: len(matched[source].get(s.name, [])) if percolate
+                    else len(query_planner.jobs_for_search(jobs, s))
+                    for source, jobs in ingested.items()
+                },
+                "new_count": len(new_items),
+                "emailed": notify(mailer, s.name, new_items),
+                "errors": errors,
+            })
+
+    # Phase 3 (percolate): everything this run inserted, against every search
+    # at once; a job fetched for one group can match searches in any group
+    if percolate:
+        found = task_runner.percolate_new_jobs(db, percolator, inserted_jobs, inserted_ids)
+        for result in out:
+            new_items = found.get(result["name"], [])
+            result["new_count"] = len(new_items)
+            result["emailed"] = notify(mailer, result["name"], new_items)
+
+    return {"ran": len(out), "upstream_queries": len(plan), "results": out}
+
+
+@router.post("/maintenance/seen-jobs", dependencies=[Depends(require_cron_secret)])
+def maintain_seen_jobs(db: Session = Depends(get_db)):
+    """
+    Create upcoming seen_jobs partitions and drop/detach expired ones
+    (SEEN_RETENTION_DAYS / SEEN_RETENTION_ACTION). Meant for a daily cron.
+    """
+    return seen_partitions_db.run_maintenance(
+        db,
+        retention_days=settings.SEEN_RETENTION_DAYS,
+        action=settings.SEEN_RETENTION_ACTION,
+        ahead=settings.SEEN_PARTITIONS_AHEAD,
+    )
 
 
 @router.post("/email/test", dependencies=[Depends(require_cron_secret)])
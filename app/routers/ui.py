@@ -1,15 +1,20 @@
 # app/routers/ui.py
 from datetime import date, datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import select
 
-from app.api.deps import get_db
-from app.api.schemas import SavedSearchIn, SavedSearchOut, JobOut
-from app.db_models import SeenJobRow
-from app.services import saved_search_repo_db, job_repo_db
+from app.api.deps import get_async_read_db, get_db, get_read_db
+from app.api.job_json import job_dict, json_response
+from app.api.schemas import SavedSearchIn, SavedSearchOut, JobPageOut
+from app.services import (
+    job_repo_async,
+    job_repo_db,
+    saved_search_repo_async,
+    saved_search_repo_db,
+)
 from app.sources.reed import ReedApiClient
 from app.sources.adzuna import AdzunaApiClient
 from app.api.deps import get_reed_client, get_adzuna_client
@@ -17,20 +22,9 @@ from app.api.deps import get_reed_client, get_adzuna_client
 router = APIRouter(prefix="/ui", tags=["ui"])
 
 
-def to_job_out(j) -> JobOut:
-    return JobOut(
-        uid=j.uid,
-        source=j.source,
-        source_job_id=j.source_job_id,
-        title=j.title,
-        company=j.company,
-        location=j.location,
-        url=j.url,
-        posted_at=j.posted_at,
-    )
-
-
-def saved_search_payload(db: Session, row) -> Dict[str, Any]:
+def saved_search_payload(db: Session, row, seen_count: Optional[int] = None) -> Dict[str, Any]:
+    if seen_count is None:
+        seen_count = saved_search_repo_db.count_seen(db, row.name)
     return {
         "name": row.name,
         "q": row.q,
@@ -38,29 +32,39 @@ def saved_search_payload(db: Session, row) -> Dict[str, Any]:
         "location": row.location,
         "posted_after": row.posted_after,
         "limit": row.limit,
-        "seen_count": saved_search_repo_db.count_seen(db, row.name),
+        "seen_count": seen_count,
     }
 
 
 @router.get("/dashboard")
-def ui_dashboard(limit_jobs: int = 20, db: Session = Depends(get_db)):
-    searches = saved_search_repo_db.list_saved_searches(db)
-    jobs = job_repo_db.list_jobs(db, limit=limit_jobs)
+async def ui_dashboard(
+    limit_jobs: int = 20,
+    # "estimate" trails recent ingests until autovacuum/analyze runs
+    count_mode: Literal["counter", "estimate", "exact"] = "counter",
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    searches = await saved_search_repo_async.list_saved_searches(db)
+    seen = await saved_search_repo_async.count_seen_many(db, [s.name for s in searches])
+    rows, _ = await job_repo_async.list_jobs_page(db, limit=limit_jobs)
+    total_jobs = await job_repo_async.count_jobs(db, count_mode)
 
-    return {
+    return json_response({
         "stats": {
-            "total_jobs": job_repo_db.count_jobs(db),
+            "total_jobs": total_jobs,
             "search_count": len(searches),
         },
-        "searches": [saved_search_payload(db, s) for s in searches],
-        "latest_jobs": [to_job_out(j) for j in jobs],
-    }
+        "searches": [saved_search_payload(db, s, seen[s.name]) for s in searches],
+        "latest_jobs": [job_dict(r) for r in rows],
+    })
 
 
-@router.get("/jobs", response_model=List[JobOut])
-def ui_jobs(limit: int = 50, db: Session = Depends(get_db)):
-    jobs = job_repo_db.list_jobs(db, limit=limit)
-    return [to_job_out(j) for j in jobs]
+@router.get("/jobs", response_model=JobPageOut)
+def ui_jobs(limit: int = 50, cursor: Optional[str] = None, db: Session = Depends(get_read_db)):
+    try:
+        rows, next_cursor = job_repo_db.list_jobs_page(db, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response({"items": [job_dict(r) for r in rows], "next_cursor": next_cursor})
 
 
 @router.post("/searches", response_model=SavedSearchOut)
@@ -88,42 +92,45 @@ def ui_upsert_search(payload: SavedSearchIn, db: Session = Depends(get_db)):
 
 
 @router.get("/searches/{name}/feed")
-def ui_search_feed(name: str, limit: int = 50, db: Session = Depends(get_db)):
+def ui_search_feed(
+    name: str,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_read_db),
+):
     s = saved_search_repo_db.get_saved_search(db, name)
     if not s:
         raise HTTPException(status_code=404, detail="Saved search not found")
 
-    results = job_repo_db.search_jobs(
-        db,
-        q=s.q,
-        source=s.source,
-        location=s.location,
-        posted_after=s.posted_after,
-        limit=limit,
-    )
-
-    uids = [j.uid for j in results]
-    seen_set = set()
-    if uids:
-        stmt = select(SeenJobRow.job_uid).where(
-            SeenJobRow.search_name == name,
-            SeenJobRow.job_uid.in_(uids),
+    try:
+        results, next_cursor = job_repo_db.search_jobs_page(
+            db,
+            q=s.q,
+            source=s.source,
+            location=s.location,
+            posted_after=s.posted_after,
+            limit=limit,
+            cursor=cursor,
         )
-        seen_set = set(db.execute(stmt).scalars().all())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return {
+    seen_set = saved_search_repo_db.seen_job_ids(db, s.id, [j.id for j in results])
+
+    return json_response({
         "search": saved_search_payload(db, s),
-        "items": [{"job": to_job_out(j), "seen": (j.uid in seen_set)} for j in results],
-    }
+        "items": [{"job": job_dict(j), "seen": (j.id in seen_set)} for j in results],
+        "next_cursor": next_cursor,
+    })
 
 
 @router.get("/searches/{name}/new-count")
-def ui_search_new_count(name: str, limit: int = 50, db: Session = Depends(get_db)):
+def ui_search_new_count(name: str, limit: int = 50, db: Session = Depends(get_read_db)):
     s = saved_search_repo_db.get_saved_search(db, name)
     if not s:
         raise HTTPException(status_code=404, detail="Saved search not found")
 
-    results = job_repo_db.search_jobs(
+    results, _ = job_repo_db.search_jobs_page(
         db,
         q=s.q,
         source=s.source,
@@ -131,17 +138,12 @@ def ui_search_new_count(name: str, limit: int = 50, db: Session = Depends(get_db
         posted_after=s.posted_after,
         limit=limit,
     )
-    uids = [j.uid for j in results]
-    if not uids:
+    ids = [j.id for j in results]
+    if not ids:
         return {"name": name, "new_count": 0}
 
-    seen_stmt = (
-        select(SeenJobRow.job_uid)
-        .where(SeenJobRow.search_name == name)
-        .where(SeenJobRow.job_uid.in_(uids))
-    )
-    seen_set = set(db.execute(seen_stmt).scalars().all())
-    new_count = sum(1 for uid in uids if uid not in seen_set)
+    seen_set = saved_search_repo_db.seen_job_ids(db, s.id, ids)
+    new_count = sum(1 for job_id in ids if job_id not in seen_set)
 
     return {"name": name, "new_count": new_count}
 
@@ -155,7 +157,7 @@ def ui_mark_and_fetch_new(name: str, db: Session = Depends(get_db)):
 
     return {
         "search": saved_search_payload(db, row),
-        "new_jobs": [to_job_out(j) for j in new_items],
+        "new_jobs": [job_dict(j) for j in new_items],
         "new_count": len(new_items),
     }
 
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict
+
+
+class SourcePools:
+    """
+    One bounded thread pool per upstream source (reed, adzuna, ...).
+
+    WHY:
+      - Source clients wrap a sync httpx.Client, which is thread-safe, so
+        running their calls on worker threads overlaps the network waits.
+      - A pool per source caps in-flight calls per provider independently,
+        so a slow provider can't starve the other one of workers.
+    """
+
+    def __init__(self, limits: Dict[str, int]) -> None:
+        self._pools: Dict[str, ThreadPoolExecutor] = {
+            source: ThreadPoolExecutor(
+                max_workers=max(1, n), thread_name_prefix=f"fetch-{source}")
+            for source, n in limits.items()
+        }
+
+    def submit(self, source: str, fn: Callable, /, *args, **kwargs) -> Future:
+        return self._pools[source].submit(fn, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import List, Optional, Tuple
+
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.job_repo_db import (
+    COUNT_MODES,
+    COUNT_STMTS,
+    FeedKey,
+    decode_cursor,
+    keyset_plan,
+    keyset_stmt,
+    page_of,
+    ranked_stmt,
+    search_filters,
+)
+
+# Async twins of the job_repo_db read functions, for `async def` routes on an
+# AsyncSession. Statements come from job_repo_db, so both paths return the
+# same rows; only the execution differs.
+
+
+async def count_jobs(db: AsyncSession, mode: str = "counter") -> int:
+    if mode not in COUNT_MODES:
+        raise ValueError(f"Unknown count mode={mode}")
+    n = (await db.execute(COUNT_STMTS[mode])).scalar_one()
+    if mode == "estimate" and (n is None or n <= 0):
+        return await count_jobs(db, "counter")
+    return int(n)
+
+
+async def keyset_rows(
+    db: AsyncSession, filters: list, limit: int, after: Optional[FeedKey],
+) -> List[Row]:
+    where, topup = keyset_plan(filters, after)
+    rows = list((await db.execute(keyset_stmt(where, limit))).all())
+    if topup is not None and len(rows) < limit:
+        rows += (await db.execute(keyset_stmt(topup, limit - len(rows)))).all()
+    return rows
+
+
+async def list_jobs_page(
+    db: AsyncSession, *, limit: int = 50, cursor: Optional[str] = None,
+) -> Tuple[List[Row], Optional[str]]:
+    after = decode_cursor(cursor) if cursor else None
+    rows = await keyset_rows(db, [], limit + 1, after)
+    return page_of(rows, limit)
+
+
+async def search_jobs_page(
+    db: AsyncSession,
+    *,
+    q: Optional[str] = None,
+    source: Optional[str] = None,
+    location: Optional[str] = None,
+    posted_after: Optional[date] = None,
+    limit: int = 50,
+    mode: Optional[str] = None,
+    rank: bool = False,
+    fuzzy: bool = False,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Row], Optional[str]]:
+    filters, rank_by = search_filters(
+        q=q, source=source, location=location, posted_after=posted_after,
+        mode=mode, rank=rank, fuzzy=fuzzy,
+    )
+
+    if rank_by is not None:
+        if cursor:
+            raise ValueError("cursor pagination isn't available with rank ordering")
+        return list((await db.execute(ranked_stmt(filters, rank_by, limit))).all()), None
+
+    after = decode_cursor(cursor) if cursor else None
+    rows = await keyset_rows(db, filters, limit + 1, after)
+    return page_of(rows, limit)
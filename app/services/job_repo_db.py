@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import io
+import json
+from collections import Counter
+from dataclasses import dataclass
 from datetime import date, datetime
-from typing import List, Optional
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
-from sqlalchemy import and_, or_, select, func
+from sqlalchemy import ColumnElement, Select, and_, or_, select, func, literal_column, text, tuple_
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
-from app.db_models import JobRow
-from app.domain.job import Job
+from app.core.config import settings
+from app.db_models import TS_CONFIG, JobCountRow, JobRow
+from app.domain.job import Job, JobBatch
 
 
 def jobrow_from_domain(j: Job) -> dict:
@@ -24,7 +33,7 @@ def jobrow_from_domain(j: Job) -> dict:
     }
 
 
-def domain_from_jobrow(r: JobRow) -> Job:
+def domain_from_jobrow(r: Union[JobRow, Row]) -> Job:
     return Job(
         source=r.source,
         source_job_id=r.source_job_id,
@@ -36,53 +45,407 @@ def domain_from_jobrow(r: JobRow) -> Job:
     )
 
 
-def count_jobs(db: Session) -> int:
-    stmt = select(func.count()).select_from(JobRow)
-    return db.execute(stmt).scalar_one()
+COUNT_MODES = ("counter", "estimate", "exact")
+COUNT_STMTS = {
+    "counter": select(func.coalesce(func.sum(JobCountRow.job_count), 0)),
+    "estimate": text("SELECT reltuples FROM pg_class WHERE oid = 'jobs'::regclass"),
+    "exact": select(func.count()).select_from(JobRow),
+}
 
 
-def upsert_many(db: Session, jobs: List[Job]) -> int:
+def count_jobs(db: Session, mode: str = "counter") -> int:
     """
-    PostgreSQL upsert using ON CONFLICT.
-    Returns count of rows affected (roughly); for exact "inserted only" we'd do more work.
+    Total jobs in the store, by mode:
+      - "counter": sum of job_counts (one row per source). Exact for every
+        write that goes through this module; cost doesn't grow with the table.
+      - "estimate": the planner's pg_class.reltuples for jobs, refreshed by
+        (auto)VACUUM/ANALYZE. Good enough for dashboards; falls back to the
+        counter before the table has ever been analyzed (reltuples is -1 on
+        Postgres 14+, 0 before), and for an empty table, where it's free.
+      - "exact": SELECT count(*), a full scan. For reconciling the counter.
     """
-    if not jobs:
-        return 0
+    if mode not in COUNT_MODES:
+        raise ValueError(f"Unknown count mode={mode}")
+    n = db.execute(COUNT_STMTS[mode]).scalar_one()
+    if mode == "estimate" and (n is None or n <= 0):
+        return count_jobs(db, "counter")
+    return int(n)
 
-    rows = [jobrow_from_domain(j) for j in jobs]
 
-    stmt = insert(JobRow).values(rows)
+def count_jobs_by_source(db: Session) -> Dict[str, int]:
+    rows = db.execute(select(JobCountRow.source, JobCountRow.job_count)).all()
+    return {source: int(n) for source, n in rows}
 
-    update_cols = {
-        "source": stmt.excluded.source,
-        "source_job_id": stmt.excluded.source_job_id,
-        "title": stmt.excluded.title,
-        "company": stmt.excluded.company,
-        "location": stmt.excluded.location,
-        "url": stmt.excluded.url,
-        "posted_at": stmt.excluded.posted_at,
-    }
 
+def bump_job_counts(db: Session, inserted_by_source: Dict[str, int]) -> None:
+    """
+    Add newly inserted rows to job_counts. Runs in the caller's transaction,
+    so the counter commits (or rolls back) together with the rows.
+    """
+    rows = [{"source": s, "job_count": n} for s, n in inserted_by_source.items() if n]
+    if not rows:
+        return
+    stmt = insert(JobCountRow).values(rows)
     stmt = stmt.on_conflict_do_update(
-        index_elements=[JobRow.uid],
-        set_=update_cols,
+        index_elements=[JobCountRow.source],
+        set_={"job_count": JobCountRow.job_count + stmt.excluded.job_count},
     )
+    db.execute(stmt)
+
+
+def existing_uids(db: Session, uids: List[str]) -> Set[str]:
+    """
+    Which of these uids are already stored (used to stop paginating early).
+    """
+    if not uids:
+        return set()
+    stmt = select(JobRow.uid).where(JobRow.uid.in_(uids))
+    return set(db.execute(stmt).scalars().all())
 
-    res = db.execute(stmt)
+
+# 10 bind params per row: stays well under Postgres' 65535-parameter limit.
+UPSERT_CHUNK_ROWS = 1000
+# Batches at least this big go through COPY + a set-based merge instead.
+BULK_LOAD_MIN_ROWS = 5000
+BULK_LOAD_CHUNK_ROWS = 10000
+
+# Columns an upsert may change; content_hash covers the rest of them, so a
+# conflicting row whose hash matches is left alone.
+HASHED_COLS = ("source", "source_job_id", "title",
+               "company", "location", "url", "posted_at")
+UPDATABLE_COLS = HASHED_COLS + ("content_hash",)
+STAGE_COLS = ("uid",) + UPDATABLE_COLS + ("created_at",)
+
+
+@dataclass
+class UpsertCounts:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def affected(self) -> int:
+        return self.inserted + self.updated
+
+    def add(self, other: "UpsertCounts") -> "UpsertCounts":
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        return self
+
+
+def content_hash(row: dict) -> str:
+    """
+    Fingerprint of a row's stored content (HASHED_COLS).
+    WHY: comparing one indexed-width value in ON CONFLICT ... WHERE is cheaper
+    than comparing every column, and an unchanged posting then costs no
+    rewrite (no dead tuple, WAL or index churn).
+    """
+    parts = []
+    for c in HASHED_COLS:
+        v = row[c]
+        if v is None:
+            parts.append("\x00")  # distinct from ""
+        elif isinstance(v, datetime):
+            parts.append(v.isoformat())
+        else:
+            parts.append(str(v))
+    return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def iter_rows(jobs: Union[Iterable[Job], JobBatch]) -> Iterator[dict]:
+    rows = jobs.rows() if isinstance(jobs, JobBatch) else (jobrow_from_domain(j) for j in jobs)
+    for r in rows:
+        r["content_hash"] = content_hash(r)
+        yield r
+
+
+def chunked(rows: Iterator[dict], size: int) -> Iterator[List[dict]]:
+    """
+    Bounded chunks, de-duplicated by uid (last one wins): a single
+    ON CONFLICT statement can't touch the same row twice.
+    """
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield list({r["uid"]: r for r in chunk}.values())
+
+
+def upsert_many(
+    db: Session,
+    jobs: Union[List[Job], JobBatch],
+    inserted_ids: Optional[Dict[str, int]] = None,
+) -> int:
+    """
+    PostgreSQL upsert using ON CONFLICT.
+    Returns the exact number of rows inserted or changed; see upsert_counts
+    for the inserted/updated/unchanged breakdown and inserted_ids.
+    """
+    return upsert_counts(db, jobs, inserted_ids=inserted_ids).affected
+
+
+def upsert_counts(
+    db: Session,
+    jobs: Union[List[Job], JobBatch],
+    inserted_ids: Optional[Dict[str, int]] = None,
+) -> UpsertCounts:
+    """
+    Chunked multi-row INSERT ... ON CONFLICT DO UPDATE, with exact counts:
+    RETURNING (xmax = 0) is true for inserted rows and false for updated ones;
+    conflicting rows with the same content_hash are skipped by the WHERE and
+    return nothing (unchanged = rows sent - rows returned).
+
+    inserted_ids, when given, is filled with uid -> id for the rows this call
+    inserted (for percolating new jobs, see task_runner.percolate_new_jobs).
+    Big in-memory batches are handed to bulk_load, unless inserted_ids is
+    asked for; to stream a backfill call bulk_load directly (ingest bulk=true).
+    """
+    if not jobs:
+        return UpsertCounts()
+    if len(jobs) >= BULK_LOAD_MIN_ROWS and inserted_ids is None:
+        return bulk_load(db, jobs)
+
+    counts = UpsertCounts()
+    inserted_by_source: Counter = Counter()
+    for rows in chunked(iter_rows(jobs), UPSERT_CHUNK_ROWS):
+        stmt = insert(JobRow).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobRow.uid],
+            set_={c: stmt.excluded[c] for c in UPDATABLE_COLS},
+            where=JobRow.content_hash.is_distinct_from(stmt.excluded.content_hash),
+        ).returning(literal_column("xmax = 0"), JobRow.source, JobRow.uid, JobRow.id)
+
+        returned = db.execute(stmt).all()
+        inserted = 0
+        for was_inserted, source, uid, job_id in returned:
+            if was_inserted:
+                inserted += 1
+                inserted_by_source[source] += 1
+                if inserted_ids is not None:
+                    inserted_ids[uid] = job_id
+        counts.add(UpsertCounts(
+            inserted=inserted,
+            updated=len(returned) - inserted,
+            unchanged=len(rows) - len(returned),
+        ))
+
+    bump_job_counts(db, inserted_by_source)
     db.commit()
-    return res.rowcount or 0
+    return counts
+
+
+def bulk_load(
+    db: Session,
+    jobs: Union[Iterable[Job], JobBatch],
+    chunk_size: int = BULK_LOAD_CHUNK_ROWS,
+) -> UpsertCounts:
+    """
+    Bulk upsert for backfills: stream jobs in bounded chunks, COPY each chunk
+    into a temp staging table and merge it into jobs with one set-based
+    INSERT ... SELECT ... ON CONFLICT. Memory stays flat (one chunk), and
+    inserted/updated/unchanged counts are exact (same xmax trick as upsert_counts).
+
+    Each chunk is its own transaction and the staging table is ON COMMIT DROP,
+    so nothing outlives the transaction (safe behind transaction poolers).
+    """
+    cols = ", ".join(STAGE_COLS)
+    updatable = ", ".join(UPDATABLE_COLS)
+    excluded = ", ".join(f"EXCLUDED.{c}" for c in UPDATABLE_COLS)
+    merge_sql = text(f"""
+        WITH merged AS (
+            INSERT INTO jobs AS j ({cols})
+            SELECT {cols} FROM jobs_stage
+            ON CONFLICT (uid) DO UPDATE
+               SET ({updatable}) = ({excluded})
+             WHERE j.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+            RETURNING (xmax = 0) AS inserted, j.source
+        )
+        SELECT source, count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted)
+          FROM merged
+         GROUP BY source
+    """)
+
+    counts = UpsertCounts()
+    now = datetime.utcnow()
+    for rows in chunked(iter_rows(jobs), chunk_size):
+        db.execute(text(
+            "CREATE TEMP TABLE jobs_stage ("
+            " uid varchar, source varchar, source_job_id varchar, title varchar,"
+            " company varchar, location varchar, url varchar,"
+            " posted_at timestamp, content_hash varchar, created_at timestamp"
+            ") ON COMMIT DROP"
+        ))
+        copy_rows(db, "jobs_stage", STAGE_COLS,
+                  ({**r, "created_at": now} for r in rows))
+        merged = db.execute(merge_sql).all()
+        inserted = sum(n for _, n, _ in merged)
+        updated = sum(n for _, _, n in merged)
+        bump_job_counts(db, {source: n for source, n, _ in merged})
+        db.commit()
+        counts.add(UpsertCounts(
+            inserted=inserted,
+            updated=updated,
+            unchanged=len(rows) - inserted - updated,
+        ))
+    return counts
+
+
+def copy_rows(db: Session, table: str, cols: Sequence[str], rows: Iterable[dict]) -> None:
+    """
+    COPY rows into table on the session's connection (psycopg 3 or psycopg2).
+    """
+    raw = db.connection().connection.driver_connection
+    copy_sql = f"COPY {table} ({', '.join(cols)}) FROM STDIN"
+    with raw.cursor() as cur:
+        if hasattr(cur, "copy"):  # psycopg 3
+            with cur.copy(copy_sql) as copy:
+                for r in rows:
+                    copy.write_row(tuple(r[c] for c in cols))
+        else:  # psycopg2: COPY text format, one chunk buffered
+            buf = io.StringIO()
+            for r in rows:
+                buf.write("\t".join(copy_text(r[c]) for c in cols))
+                buf.write("\n")
+            buf.seek(0)
+            cur.copy_expert(copy_sql, buf)
+
+
+def copy_text(value) -> str:
+    # COPY text format: \N is NULL; backslash, tab and newlines are escaped
+    if value is None:
+        return "\\N"
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+# Feed order. Keyset cursors encode a row's position in it; the composite
+# index ix_jobs_feed_order matches it column for column.
+FEED_ORDER = (JobRow.posted_at.desc().nullslast(),
+              JobRow.created_at.desc(), JobRow.uid.desc())
+
+
+# Columns the read path selects (no ORM identity map, no deferred loads);
+# created_at is there for the cursor, id for joining to seen_jobs. Rows are
+# attribute-accessible tuples, so domain_from_jobrow and the API's job_dict
+# accept them as-is.
+READ_COLS = (JobRow.uid, JobRow.source, JobRow.source_job_id, JobRow.title,
+             JobRow.company, JobRow.location, JobRow.url, JobRow.posted_at,
+             JobRow.created_at, JobRow.id)
+
+
+class FeedKey(NamedTuple):
+    posted_at: Optional[datetime]
+    created_at: datetime
+    uid: str
+
+
+def encode_cursor(r: Row) -> str:
+    raw = json.dumps([
+        r.posted_at.isoformat() if r.posted_at else None,
+        r.created_at.isoformat(),
+        r.uid,
+    ], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> FeedKey:
+    """Raises ValueError for anything encode_cursor didn't produce."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        posted_at, created_at, uid = json.loads(raw)
+        return FeedKey(
+            datetime.fromisoformat(posted_at) if posted_at else None,
+            datetime.fromisoformat(created_at),
+            str(uid),
+        )
+    except (TypeError, ValueError) as e:  # binascii.Error/JSONDecodeError are ValueErrors
+        raise ValueError("invalid cursor") from e
+
+
+def keyset_stmt(where: list, limit: int) -> Select:
+    stmt = select(*READ_COLS)
+    if where:
+        stmt = stmt.where(and_(*where))
+    return stmt.order_by(*FEED_ORDER).limit(limit)
+
+
+def keyset_plan(filters: list, after: Optional[FeedKey]) -> Tuple[list, Optional[list]]:
+    """
+    WHERE clauses for the rows after `after` in FEED_ORDER: the main seek,
+    plus the undated tail to top up from when the main seek runs short
+    (None when there's nothing to top up from).
+
+    WHY two segments: NULLS LAST puts undated rows after every dated one, and
+    a row comparison can't express that without an OR the index can't serve.
+    So a dated cursor seeks with (posted_at, created_at, uid) < cursor and only
+    tops up from the undated tail when the dated rows run out.
+    """
+    if after is None:
+        return filters, None
+
+    undated = filters + [JobRow.posted_at.is_(None)]
+    if after.posted_at is None:
+        return undated + [
+            tuple_(JobRow.created_at, JobRow.uid) < tuple_(after.created_at, after.uid)
+        ], None
+
+    return filters + [
+        JobRow.posted_at.is_not(None),
+        tuple_(JobRow.posted_at, JobRow.created_at, JobRow.uid)
+        < tuple_(after.posted_at, after.created_at, after.uid),
+    ], undated
+
+
+def keyset_rows(db: Session, filters: list, limit: int, after: Optional[FeedKey]) -> List[Row]:
+    """
+    Up to `limit` rows matching filters that come after `after` in FEED_ORDER.
+    """
+    where, topup = keyset_plan(filters, after)
+    rows = list(db.execute(keyset_stmt(where, limit)).all())
+    if topup is not None and len(rows) < limit:
+        rows += db.execute(keyset_stmt(topup, limit - len(rows))).all()
+    return rows
 
 
 def list_jobs(db: Session, limit: int = 50) -> List[Job]:
-    stmt = (
-        select(JobRow)
-        .order_by(JobRow.posted_at.desc().nullslast(), JobRow.created_at.desc())
-        .limit(limit)
-    )
-    rows = db.execute(stmt).scalars().all()
+    rows, _ = list_jobs_page(db, limit=limit)
     return [domain_from_jobrow(r) for r in rows]
 
 
+def list_jobs_page(
+    db: Session, *, limit: int = 50, cursor: Optional[str] = None,
+) -> Tuple[List[Row], Optional[str]]:
+    """
+    One page of the feed (READ_COLS rows) plus the cursor for the next one
+    (None on the last page).
+    """
+    after = decode_cursor(cursor) if cursor else None
+    rows = keyset_rows(db, [], limit + 1, after)
+    return page_of(rows, limit)
+
+
+def page_of(rows: List[Row], limit: int) -> Tuple[List[Row], Optional[str]]:
+    # rows were fetched with limit + 1: the extra one only says "there's more"
+    more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1]) if more and rows else None
+    return rows, next_cursor
+
+
+SEARCH_MODES = ("fts", "tokens")
+
+
+def contains_ci(col, needle: str):
+    """
+    lower(col) LIKE '%needle%' (needle already lowercased; %, _ and \\ escaped).
+    WHY not ILIKE: the trigram indexes are on lower(col), so the predicate has
+    to be on that exact expression; the pattern is built here as one value.
+    """
+    escaped = needle.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return func.lower(col).like(f"%{escaped}%", escape="\\")
+
+
 def search_jobs(
     db: Session,
     *,
@@ -91,11 +454,114 @@ def search_jobs(
     location: Optional[str] = None,
     posted_after: Optional[date] = None,
     limit: int = 50,
+    mode: Optional[str] = None,
+    rank: bool = False,
+    fuzzy: bool = False,
 ) -> List[Job]:
+    rows, _ = search_jobs_page(
+        db, q=q, source=source, location=location, posted_after=posted_after,
+        limit=limit, mode=mode, rank=rank, fuzzy=fuzzy,
+    )
+    return [domain_from_jobrow(r) for r in rows]
+
+
+def search_jobs_page(
+    db: Session,
+    *,
+    q: Optional[str] = None,
+    source: Optional[str] = None,
+    location: Optional[str] = None,
+    posted_after: Optional[date] = None,
+    limit: int = 50,
+    mode: Optional[str] = None,
+    rank: bool = False,
+    fuzzy: bool = False,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Row], Optional[str]]:
+    """
+    One page of search results (READ_COLS rows) plus the next cursor.
+    Pages are keyset-paginated on FEED_ORDER via cursor; rank ordering isn't
+    part of that key, so ranked results are a single page (no next_cursor).
+    See search_filters for the matching rules.
+    """
+    filters, rank_by = search_filters(
+        q=q, source=source, location=location, posted_after=posted_after,
+        mode=mode, rank=rank, fuzzy=fuzzy,
+    )
+
+    if rank_by is not None:
+        if cursor:
+            raise ValueError("cursor pagination isn't available with rank ordering")
+        return list(db.execute(ranked_stmt(filters, rank_by, limit)).all()), None
+
+    after = decode_cursor(cursor) if cursor else None
+    rows = keyset_rows(db, filters, limit + 1, after)
+    return page_of(rows, limit)
+
+
+def ranked_stmt(filters: list, rank_by: ColumnElement, limit: int) -> Select:
+    return select(*READ_COLS).where(and_(*filters)).order_by(rank_by, *FEED_ORDER).limit(limit)
+
+
+def search_stmt(
+    *,
+    q: Optional[str] = None,
+    source: Optional[str] = None,
+    location: Optional[str] = None,
+    posted_after: Optional[date] = None,
+    limit: int = 50,
+    mode: Optional[str] = None,
+    fuzzy: bool = False,
+    created_after: Optional[datetime] = None,
+) -> Select:
+    """
+    First page of a search as an unexecuted SELECT of READ_COLS in FEED_ORDER,
+    for composing into bigger statements (e.g. saved-search evaluation).
+    created_after limits it to jobs stored since then.
+    """
+    filters, _ = search_filters(
+        q=q, source=source, location=location, posted_after=posted_after,
+        mode=mode, fuzzy=fuzzy,
+    )
+    if created_after is not None:
+        filters.append(JobRow.created_at >= created_after)
+    # the feed's own page statement: one definition of the cursor order
+    return keyset_stmt(filters, limit)
+
+
+def search_filters(
+    *,
+    q: Optional[str] = None,
+    source: Optional[str] = None,
+    location: Optional[str] = None,
+    posted_after: Optional[date] = None,
+    mode: Optional[str] = None,
+    rank: bool = False,
+    fuzzy: bool = False,
+) -> Tuple[list, Optional[ColumnElement]]:
+    """
+    WHERE clauses for a search, plus the ts_rank ordering when rank applies.
+
+    q matching depends on mode (default settings.SEARCH_MODE):
+      - "fts": websearch_to_tsquery against the GIN-indexed search_vector
+        (stemmed words, "quoted phrases", OR, -exclusions). rank=True orders
+        by ts_rank (title hits outrank company/location) before recency.
+      - "tokens": every whitespace token is a substring of title, company or
+        location. rank is ignored.
+    location is a case-insensitive substring match, or with fuzzy=True a
+    pg_trgm word-similarity match (so "Manchster" finds "Greater Manchester").
+    All substring/fuzzy predicates are on lower(col), which the trigram
+    indexes cover.
+    """
     def norm(s: Optional[str]) -> str:
         return (s or "").strip()
 
-    q_tokens = [t for t in norm(q).lower().split() if t]
+    mode = mode or settings.SEARCH_MODE
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"Unknown search mode={mode}")
+
+    q_norm = norm(q)
+    q_tokens = [t for t in q_norm.lower().split() if t]
     source_norm = norm(source).lower() if source else None
     loc_norm = norm(location).lower() if location else None
 
@@ -112,24 +578,27 @@ def search_jobs(
 
     if loc_norm:
         filters.append(JobRow.location.is_not(None))
-        filters.append(JobRow.location.ilike(f"%{loc_norm}%"))
-
-    # q token AND across title/company/location
-    for tok in q_tokens:
-        filters.append(
-            or_(
-                JobRow.title.ilike(f"%{tok}%"),
-                JobRow.company.ilike(f"%{tok}%"),
-                JobRow.location.ilike(f"%{tok}%"),
-            )
-        )
-
-    stmt = select(JobRow)
-    if filters:
-        stmt = stmt.where(and_(*filters))
+        if fuzzy:
+            # col %> 'x': word_similarity('x', col) > pg_trgm.word_similarity_threshold
+            filters.append(func.lower(JobRow.location).op("%>")(loc_norm))
+        else:
+            filters.append(contains_ci(JobRow.location, loc_norm))
 
-    stmt = stmt.order_by(JobRow.posted_at.desc().nullslast(),
-                         JobRow.created_at.desc()).limit(limit)
+    rank_by = None
+    if mode == "fts" and q_tokens:
+        tsq = func.websearch_to_tsquery(literal_column(f"'{TS_CONFIG}'"), q_norm)
+        filters.append(JobRow.search_vector.op("@@")(tsq))
+        if rank:
+            rank_by = func.ts_rank(JobRow.search_vector, tsq).desc()
+    else:
+        # q token AND across title/company/location
+        for tok in q_tokens:
+            filters.append(
+                or_(
+                    contains_ci(JobRow.title, tok),
+                    contains_ci(JobRow.company, tok),
+                    contains_ci(JobRow.location, tok),
+                )
+            )
 
-    rows = db.execute(stmt).scalars().all()
-    return [domain_from_jobrow(r) for r in rows]
+    return filters, rank_by
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import List, Optional
+
+from app.domain.job import Job
+
+
+def norm(s: Optional[str]) -> str:
+    return (s or "").strip().lower()
+
+
+def job_matches(
+    job: Job,
+    *,
+    q_tokens: List[str],
+    source: Optional[str] = None,
+    location: Optional[str] = None,
+    posted_after: Optional[date] = None,
+) -> bool:
+    """
+    In-memory version of the job_repo_db.search_jobs filters ("tokens" mode;
+    "fts" stemming isn't reproduced here, so counts can differ slightly).
+
+    WHY: lets us filter already-fetched Job lists (planner fan-out, in-memory
+    store) with the same semantics as the DB query:
+      - source: exact (case-insensitive)
+      - posted_after: posted_at date >= posted_after (undated jobs never match)
+      - location: case-insensitive substring
+      - q: every token is a substring of title, company or location
+
+    Expects q_tokens / source / location to be normalized already (see norm()).
+    """
+    if source and norm(job.source) != source:
+        return False
+
+    if posted_after:
+        if not job.posted_at or job.posted_at.date() < posted_after:
+            return False
+
+    if location and location not in norm(job.location):
+        return False
+
+    if q_tokens:
+        fields = (norm(job.title), norm(job.company), norm(job.location))
+        for tok in q_tokens:
+            if not any(tok in f for f in fields):
+                return False
+
+    return True
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from app.db_models import SavedSearchRow
+from app.domain.job import Job
+from app.services.matching import job_matches, norm
+
+# Index grams are at most this long; shorter anchors are indexed whole.
+GRAM = 3
+
+
+class _Query(NamedTuple):
+    search: SavedSearchRow
+    q_tokens: List[str]
+    source: Optional[str]
+    location: Optional[str]
+    posted_after: Optional[date]
+
+
+def _grams(text: str) -> Set[str]:
+    """Every substring of `text` up to GRAM chars long."""
+    out = set()
+    for i in range(len(text)):
+        for n in range(1, GRAM + 1):
+            if i + n > len(text):
+                break
+            out.add(text[i:i + n])
+    return out
+
+
+class Percolator:
+    """
+    Saved searches indexed for matching jobs against all of them at once
+    (the reverse of running every search against the jobs table).
+
+    Each search is filed under one gram of its longest required substring (a
+    q token or its location), per source (None = any source). A job can only
+    match a search if that gram occurs in one of its fields, so a job looks up
+    the grams of its own title/company/location and verifies just those
+    candidates with matching.job_matches ("tokens" semantics, like the
+    planner's fan-out). Searches with neither q nor location match on
+    source/posted_after alone.
+
+    Cost per job: its text length plus its candidates, not the number of
+    searches.
+    """
+
+    def __init__(self, searches: Iterable[SavedSearchRow]) -> None:
+        self._by_gram: Dict[Tuple[Optional[str], str], List[_Query]] = defaultdict(list)
+        self._unanchored: Dict[Optional[str], List[_Query]] = defaultdict(list)
+        self.searches: Dict[str, SavedSearchRow] = {}
+        for s in searches:
+            self.add(s)
+
+    def add(self, s: SavedSearchRow) -> None:
+        query = _Query(
+            search=s,
+            q_tokens=[t for t in norm(s.q).split() if t],
+            source=norm(s.source) or None,
+            location=norm(s.location) or None,
+            posted_after=s.posted_after,
+        )
+        required = query.q_tokens + ([query.location] if query.location else [])
+        if required:
+            anchor = max(required, key=len)
+            self._by_gram[(query.source, anchor[:GRAM])].append(query)
+        else:
+            self._unanchored[query.source].append(query)
+        self.searches[s.name] = s
+
+    def candidates(self, job: Job) -> List[_Query]:
+        source = norm(job.source)
+        out = self._unanchored.get(None, []) + self._unanchored.get(source, [])
+        grams: Set[str] = set()
+        for field in (job.title, job.company, job.location):
+            grams |= _grams(norm(field))
+        for gram in grams:
+            out.extend(self._by_gram.get((None, gram), ()))
+            out.extend(self._by_gram.get((source, gram), ()))
+        return out
+
+    def match(self, job: Job) -> List[SavedSearchRow]:
+        """Every indexed search this job matches."""
+        return [
+            c.search for c in self.candidates(job)
+            if job_matches(job, q_tokens=c.q_tokens, source=c.source,
+                           location=c.location, posted_after=c.posted_after)
+        ]
+
+    def percolate(self, jobs: Iterable[Job]) -> Dict[str, List[Job]]:
+        """
+        Matching jobs per search name, one pass over the jobs: each search's
+        newest `limit`, as query_planner.jobs_for_search would return them.
+        """
+        out: Dict[str, List[Job]] = defaultdict(list)
+        for job in jobs:
+            for s in self.match(job):
+                out[s.name].append(job)
+        for name, matched in out.items():
+            matched.sort(key=lambda j: j.posted_at or datetime.min, reverse=True)
+            del matched[self.searches[name].limit:]
+        return dict(out)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional
+
+from app.db_models import SavedSearchRow
+from app.domain.job import Job
+from app.services.matching import job_matches, norm
+
+
+@dataclass(frozen=True)
+class UpstreamQuery:
+    """
+    What we actually send to Reed/Adzuna.
+    Only q + location are pushed upstream; everything else is filtered locally.
+    """
+    q: str
+    location: Optional[str] = None
+
+
+KNOWN_SOURCES = ("reed", "adzuna")
+
+
+@dataclass
+class PlannedQuery:
+    """
+    One upstream query plus every saved search it serves. The properties below
+    are the filters that can be pushed down to the providers for the group:
+    the loosest requirement across its members wins.
+    """
+    query: UpstreamQuery
+    searches: List[SavedSearchRow] = field(default_factory=list)
+
+    @property
+    def sources(self) -> List[str]:
+        # an unpinned search needs every source; pinned ones only their own
+        wanted = set()
+        for s in self.searches:
+            pinned = norm(s.source)
+            if not pinned:
+                return list(KNOWN_SOURCES)
+            wanted.add(pinned)
+        return [src for src in KNOWN_SOURCES if src in wanted]
+
+    @property
+    def posted_after(self) -> Optional[date]:
+        if any(s.posted_after is None for s in self.searches):
+            return None
+        return min(s.posted_after for s in self.searches)
+
+    @property
+    def limit(self) -> int:
+        return max(s.limit for s in self.searches)
+
+
+def upstream_query_for(s: SavedSearchRow) -> UpstreamQuery:
+    # Upstream matching is case/whitespace-insensitive, so normalize the key.
+    q = " ".join(norm(s.q).split())
+    loc = norm(s.location) or None
+    return UpstreamQuery(q=q, location=loc)
+
+
+def plan_queries(searches: List[SavedSearchRow]) -> List[PlannedQuery]:
+    """
+    Group saved searches into the minimal set of distinct upstream queries.
+
+    Searches that share q/location but differ in source, posted_after or limit
+    are subsumed by one upstream query: the group's loosest source/recency/size
+    is pushed upstream (see PlannedQuery), and each search's own filters are
+    applied locally when fanning results back out (see jobs_for_search).
+    """
+    by_key: Dict[UpstreamQuery, PlannedQuery] = {}
+    for s in searches:
+        key = upstream_query_for(s)
+        planned = by_key.get(key)
+        if planned is None:
+            planned = by_key[key] = PlannedQuery(query=key)
+        planned.searches.append(s)
+    return list(by_key.values())
+
+
+def jobs_for_search(jobs: Iterable[Job], s: SavedSearchRow) -> List[Job]:
+    """
+    Fan a fetched Job list back out to one saved search,
+    filtering with the same semantics as job_repo_db.search_jobs.
+    """
+    q_tokens = [t for t in norm(s.q).split() if t]
+    source = norm(s.source) or None
+    location = norm(s.location) or None
+    matched = [
+        j for j in jobs
+        if job_matches(j, q_tokens=q_tokens, source=source,
+                       location=location, posted_after=s.posted_after)
+    ]
+    matched.sort(key=lambda j: j.posted_at or datetime.min, reverse=True)
+    return matched[:s.limit]
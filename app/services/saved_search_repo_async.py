@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db_models import SavedSearchRow
+from app.services.job_repo_db import domain_from_jobrow
+from app.services.saved_search_repo_db import (
+    count_seen_many_stmt, lock_search_stmt, new_jobs_stmt)
+
+# Async twins of the saved_search_repo_db functions (same statements).
+
+
+async def get_saved_search(db: AsyncSession, name: str) -> Optional[SavedSearchRow]:
+    stmt = select(SavedSearchRow).where(SavedSearchRow.name == name)
+    return (await db.execute(stmt)).scalars().first()
+
+
+async def list_saved_searches(db: AsyncSession) -> List[SavedSearchRow]:
+    stmt = select(SavedSearchRow).order_by(SavedSearchRow.name.asc())
+    return list((await db.execute(stmt)).scalars().all())
+
+
+async def count_seen_many(db: AsyncSession, names: List[str]) -> Dict[str, int]:
+    if not names:
+        return {}
+    counts = {name: 0 for name in names}
+    counts.update({name: n for name, n in (await db.execute(count_seen_many_stmt(names))).all()})
+    return counts
+
+
+async def new_jobs_for_search(
+    db: AsyncSession, name: str, search: Optional[SavedSearchRow] = None,
+):
+    s = search if search is not None else await get_saved_search(db, name)
+    if not s:
+        return None, []
+
+    await db.execute(lock_search_stmt(s.id))
+    rows = (await db.execute(new_jobs_stmt(s))).all()
+    await db.commit()
+
+    return s, [domain_from_jobrow(r) for r in rows]
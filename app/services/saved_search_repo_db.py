@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import Select, exists, func, literal, select, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from sqlalchemy import func, select
 
+from app.core.config import settings
 from app.db_models import SavedSearchRow, SeenJobRow
-from app.services.job_repo_db import search_jobs as db_search_jobs
+from app.services.job_repo_db import domain_from_jobrow, search_stmt
+from app.services.seen_partitions_db import reportable_since
 
 
 def upsert_saved_search(
@@ -56,56 +57,160 @@ def list_saved_searches(db: Session) -> List[SavedSearchRow]:
 
 
 def count_seen(db: Session, name: str) -> int:
-    stmt = select(func.count()).select_from(
-        SeenJobRow).where(SeenJobRow.search_name == name)
+    stmt = (
+        select(func.count())
+        .select_from(SeenJobRow)
+        .join(SavedSearchRow, SavedSearchRow.id == SeenJobRow.search_id)
+        .where(SavedSearchRow.name == name)
+    )
     return db.execute(stmt).scalar_one()
 
 
-def mark_seen_bulk(db: Session, search_name: str, job_uids: List[str]) -> None:
-    if not job_uids:
-        return
+def count_seen_many(db: Session, names: List[str]) -> Dict[str, int]:
+    """
+    Seen counts for many searches in one GROUP BY round trip
+    (instead of one count_seen query per search). Every name gets a key.
+    """
+    if not names:
+        return {}
+    counts = {name: 0 for name in names}
+    counts.update({name: n for name, n in db.execute(count_seen_many_stmt(names)).all()})
+    return counts
+
+
+def count_seen_many_stmt(names: List[str]) -> Select:
+    return (
+        select(SavedSearchRow.name, func.count())
+        .join(SeenJobRow, SeenJobRow.search_id == SavedSearchRow.id)
+        .where(SavedSearchRow.name.in_(names))
+        .group_by(SavedSearchRow.name)
+    )
 
-    rows = [{"search_name": search_name, "job_uid": uid} for uid in job_uids]
 
-    stmt = insert(SeenJobRow).values(rows).on_conflict_do_nothing(
-        constraint="uq_seen_search_job"
+def seen_job_ids(db: Session, search_id: int, job_ids: List[int]) -> Set[int]:
+    """Which of these jobs this search has already seen (a primary-key probe)."""
+    if not job_ids:
+        return set()
+    stmt = select(SeenJobRow.job_id).where(
+        SeenJobRow.search_id == search_id,
+        SeenJobRow.job_id.in_(job_ids),
     )
-    db.execute(stmt)
-    db.commit()
+    return set(db.execute(stmt).scalars().all())
 
 
-def new_jobs_for_search(db: Session, name: str):
+def lock_search_stmt(search_id) -> Select:
     """
-    Returns new jobs (not previously seen) and records them as seen.
+    Transaction-scoped advisory lock on one saved search (key: its id).
+
+    WHY: seen_jobs is partitioned on seen_at, so its primary key includes
+    seen_at and can't reject a second (search_id, job_id) row by itself.
+    Writers for a search serialize on this lock and skip pairs already seen;
+    the next statement's snapshot then includes the previous writer's rows.
     """
-    s = get_saved_search(db, name)
-    if not s:
-        return None, []
+    return select(func.pg_advisory_xact_lock(search_id))
+
 
-    results = db_search_jobs(
-        db,
+def record_seen_pairs(db: Session, pairs: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+    """
+    Mark many (search_id, job_id) pairs seen in one INSERT (the percolator's
+    matches across every search). Returns the pairs actually recorded; ones
+    already seen, or whose job predates the retention window (see
+    seen_partitions_db.reportable_since), are skipped. Takes every involved
+    search's lock_search_stmt, in id order so two callers can't deadlock.
+    """
+    pairs = sorted(set(pairs))
+    if not pairs:
+        return set()
+
+    db.execute(text(
+        "SELECT pg_advisory_xact_lock(s.id) FROM "
+        "(SELECT DISTINCT id FROM unnest(CAST(:ids AS bigint[])) AS id ORDER BY id) AS s"
+    ), {"ids": [search_id for search_id, _ in pairs]})
+    recorded = db.execute(text(
+        "INSERT INTO seen_jobs (search_id, job_id, seen_at) "
+        "SELECT p.search_id, p.job_id, :now "
+        "FROM unnest(CAST(:search_ids AS bigint[]), CAST(:job_ids AS bigint[])) AS p(search_id, job_id) "
+        "JOIN jobs j ON j.id = p.job_id "
+        "WHERE (CAST(:since AS timestamp) IS NULL OR j.created_at >= :since) "
+        "AND NOT EXISTS (SELECT 1 FROM seen_jobs s "
+        "WHERE s.search_id = p.search_id AND s.job_id = p.job_id) "
+        "RETURNING search_id, job_id"
+    ), {
+        "now": datetime.utcnow(),
+        "since": reportable_since(settings.SEEN_RETENTION_DAYS),
+        "search_ids": [search_id for search_id, _ in pairs],
+        "job_ids": [job_id for _, job_id in pairs],
+    }).all()
+    db.commit()
+    return {(search_id, job_id) for search_id, job_id in recorded}
+
+
+def new_jobs_stmt(s: SavedSearchRow) -> Select:
+    """The statement behind new_jobs_for_search (shared with the async repo)."""
+    matched = search_stmt(
         q=s.q,
         source=s.source,
         location=s.location,
         posted_after=s.posted_after,
         limit=s.limit,
+        # nothing whose seen row retention may already have dropped
+        created_after=reportable_since(settings.SEEN_RETENTION_DAYS),
+    ).cte("matched")
+
+    fresh = (
+        select(matched)
+        .where(~exists().where(
+            SeenJobRow.search_id == s.id,
+            SeenJobRow.job_id == matched.c.id,
+        ))
+        .cte("fresh")
     )
 
-    uids = [j.uid for j in results]
-    if not uids:
-        return s, []
+    ins = (
+        insert(SeenJobRow)
+        .from_select(
+            ["search_id", "job_id", "seen_at"],
+            select(literal(s.id), fresh.c.id, literal(datetime.utcnow())),
+        )
+        .returning(SeenJobRow.job_id)
+        .cte("ins")
+    )
 
-    # Fetch already-seen among these uids
-    seen_stmt = (
-        select(SeenJobRow.job_uid)
-        .where(SeenJobRow.search_name == name)
-        .where(SeenJobRow.job_uid.in_(uids))
+    return (
+        select(fresh)
+        .join(ins, ins.c.job_id == fresh.c.id)
+        .order_by(
+            fresh.c.posted_at.desc().nullslast(),
+            fresh.c.created_at.desc(),
+            fresh.c.uid.desc(),
+        )
     )
-    seen_set = set(db.execute(seen_stmt).scalars().all())
 
-    new_items = [j for j in results if j.uid not in seen_set]
 
-    # mark as seen
-    mark_seen_bulk(db, name, [j.uid for j in new_items])
+def new_jobs_for_search(db: Session, name: str, search: Optional[SavedSearchRow] = None):
+    """
+    Returns new jobs (not previously seen) and records them as seen,
+    in one statement:
+
+      matched: the search's current top `limit` jobs (among those stored
+               within SEEN_RETENTION_DAYS, see reportable_since)
+      fresh:   matched rows with no seen_jobs row (NOT EXISTS anti-join)
+      ins:     INSERT fresh ids into seen_jobs RETURNING
+      result:  fresh rows whose insert actually happened
+
+    WHY: one round trip per search and no Python-side set diff. Runs for the
+    same search hold lock_search_stmt until commit, so two concurrent runs
+    can't both report (and email) the same job: the second one's anti-join
+    sees the first one's rows.
+
+    Pass `search` when the row is already loaded to skip fetching it.
+    """
+    s = search if search is not None else get_saved_search(db, name)
+    if not s:
+        return None, []
+
+    db.execute(lock_search_stmt(s.id))
+    rows = db.execute(new_jobs_stmt(s)).all()
+    db.commit()
 
-    return s, new_items
+    return s, [domain_from_jobrow(r) for r in rows]
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# seen_jobs is range-partitioned by calendar month on seen_at (see SeenJobRow):
+# one table per month, named seen_jobs_pYYYYMM, covering [1st, next 1st).
+PARENT = "seen_jobs"
+_NAME = re.compile(rf"^{PARENT}_p(\d{{4}})(\d{{2}})$")
+
+RETENTION_ACTIONS = ("drop", "detach")
+
+# ATTACH/DETACH/DROP take an exclusive lock on seen_jobs; give up rather than
+# queue behind a long reader and stall every writer queued behind us
+LOCK_TIMEOUT = "5s"
+
+# Partition creators take this transaction lock. Two-int key space, so it
+# can't collide with the per-search locks (single bigint keys).
+CREATE_LOCK_STMT = text("SELECT pg_advisory_xact_lock(hashtext(:parent), 0)")
+
+
+def month_start(d: date) -> date:
+    return date(d.year, d.month, 1)
+
+
+def add_months(month: date, n: int) -> date:
+    y, m = divmod(month.month - 1 + n, 12)
+    return date(month.year + y, m + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_p{month.year:04d}{month.month:02d}"
+
+
+def list_partitions(db: Session) -> Dict[date, str]:
+    """Attached monthly partitions, by month (detached tables aren't listed)."""
+    rows = db.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = CAST(:parent AS regclass)"
+    ), {"parent": PARENT}).scalars().all()
+    out: Dict[date, str] = {}
+    for name in rows:
+        m = _NAME.match(name)
+        if m:
+            out[date(int(m.group(1)), int(m.group(2)), 1)] = name
+    return out
+
+
+def ensure_partitions(db: Session, *, ahead: int, now: Optional[datetime] = None) -> List[str]:
+    """
+    Create this month's partition and the next `ahead` months' if missing.
+    There is no default partition (rows in one would block creating the
+    matching month later), so inserts need these to exist: besides the
+    maintenance task, app startup and every /tasks run call this.
+
+    Creators serialize on an advisory lock, so workers booting together don't
+    race on the same CREATE (IF NOT EXISTS alone doesn't stop two concurrent
+    ones colliding in the catalog).
+    """
+    current = month_start((now or datetime.utcnow()).date())
+    existing = list_partitions(db)
+    created = []
+    for i in range(ahead + 1):
+        month = add_months(current, i)
+        if month in existing:
+            continue
+        name = partition_name(month)
+        # lock_timeout bounds the advisory wait too
+        db.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'"))
+        db.execute(CREATE_LOCK_STMT, {"parent": PARENT})
+        if db.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is None:
+            db.execute(text(
+                f"CREATE TABLE {name} PARTITION OF {PARENT} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            ))
+            created.append(name)
+        db.commit()
+    return created
+
+
+def expired_partitions(
+    partitions: Dict[date, str], *, retention_days: int, now: Optional[datetime] = None,
+) -> List[str]:
+    """Partitions whose whole month ended more than retention_days ago."""
+    if retention_days <= 0:
+        return []
+    cutoff = (now or datetime.utcnow()).date() - timedelta(days=retention_days)
+    return [name for month, name in sorted(partitions.items()) if add_months(month, 1) <= cutoff]
+
+
+def reportable_since(retention_days: int, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Oldest created_at a job may have and still be reported as new (None: no
+    retention, anything goes).
+
+    WHY: pruning forgets seen_jobs rows by seen_at month, yet an old job can
+    stay in a search's top results indefinitely; once its row is gone it would
+    look unseen and be emailed again. A job's seen rows are written no earlier
+    than the job itself, so for jobs created since this point they're always
+    in partitions expired_partitions keeps.
+    """
+    if retention_days <= 0:
+        return None
+    return (now or datetime.utcnow()) - timedelta(days=retention_days)
+
+
+def prune_partitions(
+    db: Session, *, retention_days: int, action: str = "drop", now: Optional[datetime] = None,
+) -> List[str]:
+    """
+    Drop (or detach, leaving a standalone table to archive) expired partitions.
+
+    WHY: dropping a month is a catalog change; the equivalent DELETE would
+    touch every row, bloat the table and need a vacuum afterwards.
+    """
+    if action not in RETENTION_ACTIONS:
+        raise ValueError(f"Unknown retention action {action!r}")
+
+    expired = expired_partitions(list_partitions(db), retention_days=retention_days, now=now)
+    for name in expired:
+        db.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'"))
+        if action == "detach":
+            db.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}"))
+        else:
+            db.execute(text(f"DROP TABLE {name}"))
+        db.commit()  # one short lock per partition
+    return expired
+
+
+def run_maintenance(
+    db: Session, *, retention_days: int, action: str, ahead: int, now: Optional[datetime] = None,
+) -> Dict[str, List[str]]:
+    created = ensure_partitions(db, ahead=ahead, now=now)
+    pruned = prune_partitions(db, retention_days=retention_days, action=action, now=now)
+    return {"created": created, "dropped" if action == "drop" else "detached": pruned}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Dict, List, Optional
 from app.domain.job import Job
+from app.services.matching import job_matches, norm
 from datetime import date, datetime
 
 
@@ -54,39 +55,15 @@ class InMemoryJobStore:
         limit: int = 50,
     ) -> List[Job]:
 
-        def norm(s: Optional[str]) -> str:
-            return (s or "").strip().lower()
-
         q_tokens = [t for t in norm(q).split() if t] if q else []
         source_norm = norm(source) if source else None
         loc_norm = norm(location) if location else None
 
-        results: List[Job] = []
-
-        for job in self._jobs_by_uid.values():
-            # source filter
-            if source_norm and norm(job.source) != source_norm:
-                continue
-
-            # posted_after filter
-            if posted_after:
-                if not job.posted_at:
-                    continue
-                if job.posted_at.date() < posted_after:
-                    continue
-
-            # location filter
-            if loc_norm and loc_norm not in norm(job.location):
-                continue
-
-            # q filter (token AND across title/company/location)
-            if q_tokens:
-                haystack = " ".join(
-                    [norm(job.title), norm(job.company), norm(job.location)])
-                if not all(tok in haystack for tok in q_tokens):
-                    continue
-
-            results.append(job)
+        results: List[Job] = [
+            job for job in self._jobs_by_uid.values()
+            if job_matches(job, q_tokens=q_tokens, source=source_norm,
+                           location=loc_norm, posted_after=posted_after)
+        ]
 
         results.sort(key=lambda j: j.posted_at or datetime.min, reverse=True)
         return results[:limit]
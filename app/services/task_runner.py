@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import math
+from concurrent.futures import Future
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from sqlalchemy.orm import Session
+
+from app.db_models import IngestWatermarkRow
+from app.domain.job import Job, JobBatch
+from app.services import job_repo_db, saved_search_repo_db, watermark_repo_db
+from app.services.fanout import SourcePools
+from app.services.percolator import Percolator
+from app.services.query_planner import PlannedQuery, UpstreamQuery
+from app.services.watermark_repo_db import WatermarkKey
+from app.sources.adzuna import AdzunaApiClient
+from app.sources.reed import ReedApiClient
+
+SOURCES = ("reed", "adzuna")
+
+Watermarks = Dict[WatermarkKey, IngestWatermarkRow]
+
+
+def start_of(d: Optional[date]) -> Optional[datetime]:
+    # same date granularity as search_jobs: posted_at >= posted_after 00:00:00
+    return datetime.combine(d, datetime.min.time()) if d else None
+
+
+def days_since(d: Optional[date]) -> Optional[int]:
+    if d is None:
+        return None
+    return max(1, (datetime.utcnow().date() - d).days + 1)
+
+
+def min_days(*values: Optional[int]) -> Optional[int]:
+    present = [v for v in values if v is not None]
+    return min(present) if present else None
+
+
+def load_watermarks(db: Session, queries: List[UpstreamQuery]) -> Watermarks:
+    keys = [
+        (source, watermark_repo_db.query_key(q.q, q.location))
+        for q in queries
+        for source in SOURCES
+    ]
+    return watermark_repo_db.get_watermarks(db, keys)
+
+
+def fetch_pages(pages: Iterable[List[Job]]) -> List[Job]:
+    # runs on a source pool thread: drain a page iterator into one list
+    return [j for page in pages for j in page]
+
+
+def submit_fetches(
+    pools: SourcePools,
+    reed: ReedApiClient,
+    adzuna: AdzunaApiClient,
+    planned: PlannedQuery,
+    watermarks: Watermarks,
+) -> Dict[str, Future]:
+    """
+    Start the upstream fetches for one planned query (runs on the source pools),
+    pushing down every filter the providers understand:
+      - source: providers no search in the group wants are skipped entirely
+      - size: pages are sized (and counted) from the group's largest limit
+      - posted_after: Adzuna max_days_old; Reed has no recency param, so its
+        paging stops at the first page older than the cutoff instead
+      - watermark: once a query has an Adzuna watermark, ask Adzuna for
+        newest-first results no older than it (Reed: trimmed in ingest_fetched)
+    """
+    query = planned.query
+    key = watermark_repo_db.query_key(query.q, query.location)
+    cutoff = start_of(planned.posted_after)
+    wm_days = watermark_repo_db.max_days_old(watermarks.get(("adzuna", key)))
+    days = min_days(wm_days, days_since(planned.posted_after))
+
+    futures: Dict[str, Future] = {}
+    if "reed" in planned.sources:
+        size = min(planned.limit, reed.MAX_PAGE_SIZE)
+        futures["reed"] = pools.submit("reed", fetch_pages, reed.iter_pages(
+            keywords=query.q,
+            location_name=query.location,
+            page_size=size,
+            max_pages=math.ceil(planned.limit / size),
+            posted_cutoff=cutoff,
+        ))
+    if "adzuna" in planned.sources:
+        size = min(planned.limit, adzuna.MAX_PAGE_SIZE)
+        futures["adzuna"] = pools.submit("adzuna", fetch_pages, adzuna.iter_pages(
+            what=query.q,
+            where=query.location,
+            page_size=size,
+            max_pages=math.ceil(planned.limit / size),
+            posted_cutoff=cutoff,
+            max_days_old=days,
+            sort_by="date" if wm_days else None,
+        ))
+    return futures
+
+
+def collect(futures: Dict[str, Future]) -> Tuple[Dict[str, List[Job]], Dict[str, str]]:
+    """
+    Wait for a query's fetches. A source that failed (after retries, with
+    its circuit open, or on a payload its parser couldn't handle) is
+    reported in errors instead of aborting the run.
+    """
+    fetched: Dict[str, List[Job]] = {}
+    errors: Dict[str, str] = {}
+    for source, f in futures.items():
+        try:
+            fetched[source] = f.result()
+        except HTTPException as e:
+            errors[source] = str(e.detail)
+        except Exception as e:
+            errors[source] = f"{type(e).__name__}: {e}"
+    return fetched, errors
+
+
+def ingest_fetched(
+    db: Session,
+    planned: PlannedQuery,
+    fetched: Dict[str, List[Job]],
+    watermarks: Watermarks,
+    inserted_ids: Optional[Dict[str, int]] = None,
+) -> Dict[str, JobBatch]:
+    """
+    Drop postings no search in the group can match (older than its posted_after)
+    and postings at/below each (source, query) watermark, upsert the rest and
+    advance the watermark. Returns the jobs actually upserted per source,
+    which in steady state is close to nothing. inserted_ids collects
+    uid -> id of the rows that were new (see job_repo_db.upsert_counts).
+    """
+    query = planned.query
+    key = watermark_repo_db.query_key(query.q, query.location)
+    cutoff = start_of(planned.posted_after)
+    kept: Dict[str, JobBatch] = {}
+
+    for source, jobs in fetched.items():
+        if cutoff is not None:
+            jobs = [j for j in jobs if j.posted_at is not None and j.posted_at >= cutoff]
+        wm = watermarks.get((source, key))
+        fresh = JobBatch(watermark_repo_db.newer_than(jobs, wm))
+        job_repo_db.upsert_many(db, fresh, inserted_ids=inserted_ids)
+        watermark_repo_db.advance(
+            db, source=source, key=key, jobs=fresh, current=wm)
+        kept[source] = fresh
+
+    return kept
+
+
+def percolate_new_jobs(
+    db: Session,
+    percolator: Percolator,
+    jobs: Iterable[Job],
+    inserted_ids: Dict[str, int],
+) -> Dict[str, List[Job]]:
+    """
+    New-job detection from the job side (NEW_JOBS_MODE="percolate"): match the
+    jobs this run inserted against every indexed saved search in one pass
+    (each search capped to its newest `limit`, like the search-first path)
+    and record the matches in seen_jobs with one INSERT.
+    Returns the newly recorded jobs per search name, newest first.
+
+    WHY: the search-first path (saved_search_repo_db.new_jobs_for_search)
+    runs a jobs-table query per search per run; this costs one pass over the
+    new jobs whatever the number of searches.
+    """
+    new_jobs = {j.uid: j for j in jobs if j.uid in inserted_ids}
+    matched = percolator.percolate(new_jobs.values())
+    by_name = percolator.searches
+
+    recorded = saved_search_repo_db.record_seen_pairs(db, (
+        (by_name[name].id, inserted_ids[j.uid])
+        for name, matched_jobs in matched.items()
+        for j in matched_jobs
+    ))
+
+    out: Dict[str, List[Job]] = {}
+    for name, matched_jobs in matched.items():
+        search_id = by_name[name].id
+        kept = [j for j in matched_jobs if (search_id, inserted_ids[j.uid]) in recorded]
+        if kept:
+            out[name] = kept
+    return out
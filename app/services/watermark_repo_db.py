@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.db_models import IngestWatermarkRow
+from app.domain.job import Job
+
+WatermarkKey = Tuple[str, str]  # (source, query_key)
+
+
+def query_key(q: str, location: Optional[str]) -> str:
+    # q/location are expected to be normalized already (see query_planner)
+    return f"{q}|{location or ''}"
+
+
+def get_watermarks(db: Session, keys: List[WatermarkKey]) -> Dict[WatermarkKey, IngestWatermarkRow]:
+    """
+    Load many watermarks in one round trip.
+    """
+    if not keys:
+        return {}
+    stmt = select(IngestWatermarkRow).where(
+        tuple_(IngestWatermarkRow.source, IngestWatermarkRow.query_key).in_(keys)
+    )
+    rows = db.execute(stmt).scalars().all()
+    return {(r.source, r.query_key): r for r in rows}
+
+
+def newer_than(jobs: List[Job], wm: Optional[IngestWatermarkRow]) -> List[Job]:
+    """
+    Keep only postings newer than the watermark.
+    At exactly the watermark timestamp, keep uids we haven't seen there yet.
+    Undated postings can't be ordered, so once a watermark exists they're skipped.
+    """
+    if wm is None or wm.newest_posted_at is None:
+        return list(jobs)
+
+    seen_at_newest = set(wm.newest_uids or [])
+    out: List[Job] = []
+    for j in jobs:
+        if j.posted_at is None:
+            continue
+        if j.posted_at > wm.newest_posted_at:
+            out.append(j)
+        elif j.posted_at == wm.newest_posted_at and j.uid not in seen_at_newest:
+            out.append(j)
+    return out
+
+
+def advance(
+    db: Session,
+    *,
+    source: str,
+    key: str,
+    jobs: Iterable[Job],
+    current: Optional[IngestWatermarkRow],
+) -> None:
+    """
+    Move the (source, key) watermark forward to the newest posting in jobs.
+    No-op when jobs has nothing newer than the current watermark.
+    """
+    dated = [j for j in jobs if j.posted_at is not None]
+    if not dated:
+        return
+
+    newest = max(j.posted_at for j in dated)
+    uids = {j.uid for j in dated if j.posted_at == newest}
+
+    if current is not None and current.newest_posted_at is not None:
+        if newest < current.newest_posted_at:
+            return
+        if newest == current.newest_posted_at:
+            uids |= set(current.newest_uids or [])
+
+    now = datetime.utcnow()
+    stmt = insert(IngestWatermarkRow).values(
+        source=source,
+        query_key=key,
+        newest_posted_at=newest,
+        newest_uids=sorted(uids),
+        updated_at=now,
+    ).on_conflict_do_update(
+        index_elements=[IngestWatermarkRow.source, IngestWatermarkRow.query_key],
+        set_={
+            "newest_posted_at": newest,
+            "newest_uids": sorted(uids),
+            "updated_at": now,
+        },
+    )
+    db.execute(stmt)
+    db.commit()
+
+
+def max_days_old(wm: Optional[IngestWatermarkRow], now: Optional[datetime] = None) -> Optional[int]:
+    """
+    Recency window (whole days, rounded up) that still covers the watermark.
+    Used for providers that can filter by age (Adzuna max_days_old).
+    """
+    if wm is None or wm.newest_posted_at is None:
+        return None
+    now = now or datetime.utcnow()
+    return max(1, (now - wm.newest_posted_at).days + 1)
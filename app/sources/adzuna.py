@@ -1,21 +1,36 @@
-from app.domain.job import Job, parse_adzuna_date_iso
-from typing import List, Optional, Dict
+from app.domain.job import Job
+from app.sources import payloads
+from app.sources.base import BaseSourceClient, KnownUids, paginate
+from app.sources.cache import ResponseCache
+from typing import Iterator, List, Optional, Dict
+from datetime import datetime
 from fastapi import HTTPException
 import httpx
 
 
-class AdzunaApiClient:
+class AdzunaApiClient(BaseSourceClient):
     """
     Raw Adzuna API client (returns JSON) — great for quickly testing endpoint + keys.
     """
     BASE_URL = "https://api.adzuna.com/v1/api"
+    MAX_PAGE_SIZE = 50  # Adzuna caps results_per_page at 50
+    source = "adzuna"
 
-    def __init__(self, app_id: str, app_key: str, client: httpx.Client):
+    def __init__(self, app_id: str, app_key: str, client: httpx.Client, cache: Optional[ResponseCache] = None, **resilience):
         self.app_id = app_id
         self.app_key = app_key
-        self.client = client
+        super().__init__(client, cache, **resilience)
 
-    def search_raw(self, *, what: str, where: Optional[str] = None, results_per_page: int = 10, page: int = 1, country: str = "gb") -> Dict:
+    def raise_for_status(self, resp: httpx.Response) -> None:
+        if resp.status_code in (401, 403):
+            raise HTTPException(
+                status_code=401, detail="Adzuna auth failed. Check ADZUNA_APP_ID/ADZUNA_APP_KEY.")
+        if resp.status_code >= 400:
+            raise HTTPException(
+                status_code=502, detail=f"Adzuna error {resp.status_code}: {resp.text[:200]}")
+
+    def search_body(self, *, what: str, where: Optional[str] = None, results_per_page: int = 10, page: int = 1, country: str = "gb",
+                    max_days_old: Optional[int] = None, sort_by: Optional[str] = None) -> bytes:
         params = {
             "app_id": self.app_id,
             "app_key": self.app_key,
@@ -24,47 +39,71 @@ class AdzunaApiClient:
         }
         if where:
             params["where"] = where
+        if max_days_old:
+            params["max_days_old"] = max_days_old
+        if sort_by:
+            params["sort_by"] = sort_by  # "date" | "relevance" | "salary"
 
         url = f"{self.BASE_URL}/jobs/{country}/search/{page}"
-        resp = self.client.get(url, params=params)
-
-        if resp.status_code in (401, 403):
-            raise HTTPException(
-                status_code=401, detail="Adzuna auth failed. Check ADZUNA_APP_ID/ADZUNA_APP_KEY.")
-        if resp.status_code >= 400:
-            raise HTTPException(
-                status_code=502, detail=f"Adzuna error {resp.status_code}: {resp.text[:200]}")
-        return resp.json()
+        return self.get_body(url, params)
 
-    def search(self, *, what: str, where: Optional[str] = None, results_per_page: int = 10, page: int = 1, country: str = "gb") -> List[Job]:
-        data = self.search_raw(
+    def search_raw(self, *, what: str, where: Optional[str] = None, results_per_page: int = 10, page: int = 1, country: str = "gb",
+                   max_days_old: Optional[int] = None, sort_by: Optional[str] = None) -> Dict:
+        body = self.search_body(
             what=what,
             where=where,
             results_per_page=results_per_page,
             page=page,
             country=country,
+            max_days_old=max_days_old,
+            sort_by=sort_by,
         )
+        return payloads.loads(body)
 
-        jobs: List[Job] = []
-        for item in data.get("results", []):
-            job_id = item.get("id")
-            title = item.get("title")
-            if not job_id or not title:
-                continue
-
-            company = (item.get("company") or {}).get("display_name")
-            location = (item.get("location") or {}).get("display_name")
-            url = item.get("redirect_url")
+    def search(self, *, what: str, where: Optional[str] = None, results_per_page: int = 10, page: int = 1, country: str = "gb",
+               max_days_old: Optional[int] = None, sort_by: Optional[str] = None) -> List[Job]:
+        body = self.search_body(
+            what=what,
+            where=where,
+            results_per_page=results_per_page,
+            page=page,
+            country=country,
+            max_days_old=max_days_old,
+            sort_by=sort_by,
+        )
+        # projection decode: only the fields Job needs (see sources.payloads)
+        return payloads.adzuna_jobs_from_body(body)
 
-            jobs.append(
-                Job(
-                    source="adzuna",
-                    source_job_id=str(job_id),
-                    title=title,
-                    company=company,
-                    location=location,
-                    url=url,
-                    posted_at=parse_adzuna_date_iso(item.get("created")),
-                )
-            )
-        return jobs
+    def iter_pages(
+        self,
+        *,
+        what: str,
+        where: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        start_page: int = 1,
+        max_pages: int = 1,
+        known_uids: Optional[KnownUids] = None,
+        posted_cutoff: Optional[datetime] = None,
+        country: str = "gb",
+        max_days_old: Optional[int] = None,
+        sort_by: Optional[str] = None,
+    ) -> Iterator[List[Job]]:
+        """
+        Page through results (Adzuna pages are 1-based), yielding one Job batch per page.
+        See sources.base.paginate for the early-stop rules.
+        """
+        page_size = min(page_size, self.MAX_PAGE_SIZE)
+        return paginate(
+            lambda page_no: self.search(
+                what=what,
+                where=where,
+                results_per_page=page_size,
+                page=start_page + page_no,
+                country=country,
+                max_days_old=max_days_old,
+                sort_by=sort_by,
+            ),
+            max_pages=max_pages,
+            known_uids=known_uids,
+            posted_cutoff=posted_cutoff,
+        )
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+import httpx
+from fastapi import HTTPException
+
+from app.domain.job import Job
+from app.sources.cache import ResponseCache, make_cache_key
+from app.sources.resilience import RETRYABLE_STATUS, CircuitBreaker, RetryPolicy, TokenBucket
+
+# Given a page of uids, return the ones we already have stored.
+KnownUids = Callable[[List[str]], Set[str]]
+
+
+class BaseSourceClient:
+    """
+    Shared HTTP plumbing for source clients (Reed, Adzuna, ...).
+
+    WHY: every source does the same "GET -> check status -> body" dance;
+    keeping it in one place means cross-cutting concerns (response cache,
+    rate limiting, retries, circuit breaking) are added once instead of per source.
+    Subclasses set `source` and implement `raise_for_status`.
+    """
+    source: str = ""
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        cache: Optional[ResponseCache] = None,
+        *,
+        limiter: Optional[TokenBucket] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.client = client
+        self.cache = cache
+        self.limiter = limiter
+        self.retry = retry or RetryPolicy(
+            max_attempts=1, base_delay=0, max_delay=0)
+        self.breaker = breaker
+
+    def raise_for_status(self, resp: httpx.Response) -> None:
+        raise NotImplementedError
+
+    def get_body(self, url: str, params: Dict) -> bytes:
+        """
+        GET url and return the raw response body, served from the response
+        cache when an identical request is still fresh.
+        """
+        key = make_cache_key(self.source, url, params) if self.cache else None
+        if key is not None:
+            body = self.cache.get(key)
+            if body is not None:
+                return body
+
+        resp = self.send_with_retries(url, params)
+        self.raise_for_status(resp)
+        body = resp.content
+
+        if key is not None:
+            self.cache.set(key, body)
+        return body
+
+    def send_with_retries(self, url: str, params: Dict) -> httpx.Response:
+        """
+        GET with pacing (token bucket), jittered exponential retries on
+        429/5xx/timeouts (honouring Retry-After) and a circuit breaker.
+        Non-retryable responses (e.g. 401) are returned as-is for raise_for_status.
+        """
+        name = self.source.capitalize()
+
+        for attempt in range(1, self.retry.max_attempts + 1):
+            if self.breaker is not None and not self.breaker.allow():
+                raise HTTPException(
+                    status_code=503, detail=f"{name} temporarily unavailable (circuit open)")
+            if self.limiter is not None:
+                self.limiter.acquire()
+
+            last = attempt == self.retry.max_attempts
+            try:
+                resp = self.client.get(url, params=params)
+            except httpx.TransportError as e:
+                if self.breaker is not None:
+                    self.breaker.record_failure()
+                if last:
+                    raise HTTPException(
+                        status_code=504, detail=f"{name} request failed: {type(e).__name__}")
+                time.sleep(self.retry.delay(attempt))
+                continue
+
+            if resp.status_code in RETRYABLE_STATUS:
+                if self.breaker is not None:
+                    self.breaker.record_failure()
+                if last:
+                    return resp
+                time.sleep(self.retry.delay(attempt, resp))
+                continue
+
+            if self.breaker is not None:
+                # only a real answer proves the provider healthy; 4xx (bad key,
+                # bad params) says nothing either way
+                if resp.status_code < 400:
+                    self.breaker.record_success()
+                else:
+                    self.breaker.release()
+            return resp
+
+
+def paginate(
+    fetch_page: Callable[[int], List[Job]],
+    *,
+    max_pages: int,
+    known_uids: Optional[KnownUids] = None,
+    posted_cutoff: Optional[datetime] = None,
+) -> Iterator[List[Job]]:
+    """
+    Yield Job pages from fetch_page(0), fetch_page(1), ... until one of:
+      - max_pages pages fetched
+      - an empty page (ran past the last result)
+      - a page made up entirely of uids we already know (known_uids)
+      - a page made up entirely of postings older than posted_cutoff
+
+    WHY: one code path for deep backfills (big max_pages, no stop conditions)
+    and cheap incremental polls (stop at the first fully-known/old page).
+    Only one page is held in memory at a time. Pages that trigger an early
+    stop are not yielded, since there's nothing new in them.
+    """
+    for page_no in range(max_pages):
+        jobs = fetch_page(page_no)
+        if not jobs:
+            return
+
+        if posted_cutoff and all(
+            j.posted_at is not None and j.posted_at < posted_cutoff for j in jobs
+        ):
+            return
+
+        if known_uids and len(known_uids([j.uid for j in jobs])) == len({j.uid for j in jobs}):
+            return
+
+        yield jobs
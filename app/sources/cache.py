@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Protocol, Tuple
+
+from app.core.config import settings
+
+# Query params that identify *who* is asking, not *what* is asked.
+# Never part of a cache key (and never written to disk).
+SECRET_PARAMS = {"app_id", "app_key"}
+
+
+def make_cache_key(source: str, url: str, params: Dict) -> str:
+    """
+    Canonical key for an upstream request: same query -> same key,
+    regardless of dict order, value types (25 vs "25") or credentials.
+    """
+    canon = {
+        k: str(v) for k, v in params.items()
+        if v is not None and k not in SECRET_PARAMS
+    }
+    return f"{source}|{url}|{json.dumps(canon, sort_keys=True, separators=(',', ':'))}"
+
+
+class ResponseCache(Protocol):
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, body: bytes) -> None: ...
+
+    def stats(self) -> Dict[str, int]: ...
+
+    def close(self) -> None: ...
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class MemoryResponseCache:
+    """
+    In-process TTL + LRU cache of raw response bodies.
+
+    WHY:
+      - Identical upstream queries inside the TTL (debug endpoints, UI button
+        mashing, back-to-back cron runs) shouldn't spend API quota.
+      - LRU eviction keeps it within max_entries AND max_bytes.
+      - A lock makes it safe to share across the source worker pools.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int, max_bytes: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = _Counters()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self._counters.misses += 1
+                return None
+
+            expires_at, body = item
+            if expires_at <= time.monotonic():
+                self._drop(key)
+                self._counters.expirations += 1
+                self._counters.misses += 1
+                return None
+
+            self._items.move_to_end(key)
+            self._counters.hits += 1
+            return body
+
+    def set(self, key: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return  # would evict everything else and still not fit
+
+        with self._lock:
+            if key in self._items:
+                self._drop(key)
+            self._items[key] = (time.monotonic() + self.ttl_seconds, body)
+            self._bytes += len(body)
+
+            while len(self._items) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._items))
+                self._drop(oldest)
+                self._counters.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                **self._counters.as_dict(),
+                "entries": len(self._items),
+                "bytes": self._bytes,
+            }
+
+    def close(self) -> None:
+        pass
+
+    def _drop(self, key: str) -> None:
+        _, body = self._items.pop(key)
+        self._bytes -= len(body)
+
+
+class DiskResponseCache:
+    """
+    Same policy as MemoryResponseCache, persisted in a SQLite file so cached
+    responses survive restarts. TTLs use wall-clock time for that reason.
+    """
+
+    def __init__(self, path: str, *, ttl_seconds: float, max_entries: int, max_bytes: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " expires_at REAL NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " body BLOB NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_responses_last_used ON responses (last_used)")
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._counters = _Counters()
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._counters.misses += 1
+                return None
+
+            expires_at, body = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self._counters.expirations += 1
+                self._counters.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._counters.hits += 1
+            return bytes(body)
+
+    def set(self, key: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, last_used, size, body)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, now + self.ttl_seconds, now, len(body), body),
+            )
+            self._counters.evictions += self._evict()
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT count(*), coalesce(sum(size), 0) FROM responses"
+            ).fetchone()
+            return {**self._counters.as_dict(), "entries": entries, "bytes": size}
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _evict(self) -> int:
+        evicted = 0
+        entries, size = self._conn.execute(
+            "SELECT count(*), coalesce(sum(size), 0) FROM responses"
+        ).fetchone()
+        rows: Iterable = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used ASC"
+        ).fetchall() if (entries > self.max_entries or size > self.max_bytes) else []
+
+        for key, row_size in rows:
+            if entries <= self.max_entries and size <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            entries -= 1
+            size -= row_size
+            evicted += 1
+        return evicted
+
+
+def make_response_cache() -> Optional[ResponseCache]:
+    backend = settings.SOURCE_CACHE_BACKEND
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return MemoryResponseCache(
+            ttl_seconds=settings.SOURCE_CACHE_TTL_SECONDS,
+            max_entries=settings.SOURCE_CACHE_MAX_ENTRIES,
+            max_bytes=settings.SOURCE_CACHE_MAX_BYTES,
+        )
+    if backend == "disk":
+        return DiskResponseCache(
+            settings.SOURCE_CACHE_PATH,
+            ttl_seconds=settings.SOURCE_CACHE_TTL_SECONDS,
+            max_entries=settings.SOURCE_CACHE_MAX_ENTRIES,
+            max_bytes=settings.SOURCE_CACHE_MAX_BYTES,
+        )
+    raise RuntimeError(f"Unknown SOURCE_CACHE_BACKEND={backend}")
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional, Union
+
+from app.domain.job import Job, parse_adzuna_date_iso, parse_reed_date
+
+# Optional fast decoders. Both are drop-in: without them we fall back to the
+# stdlib json module and produce exactly the same Job lists.
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads(body: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+# --- typed projections (msgspec) ----------------------------------------------
+# Only the fields we map are declared; msgspec skips everything else in the
+# payload (descriptions, salaries, ...) without allocating Python objects for it.
+if msgspec is not None:
+    class _ReedItem(msgspec.Struct):
+        jobId: Optional[Union[int, str]] = None
+        jobTitle: Optional[str] = None
+        employerName: Optional[str] = None
+        locationName: Optional[str] = None
+        jobUrl: Optional[str] = None
+        date: Optional[str] = None
+
+    class _ReedPage(msgspec.Struct):
+        results: List[_ReedItem] = []
+
+    class _AdzunaNamed(msgspec.Struct):
+        display_name: Optional[str] = None
+
+    class _AdzunaItem(msgspec.Struct):
+        id: Optional[Union[int, str]] = None
+        title: Optional[str] = None
+        company: Optional[_AdzunaNamed] = None
+        location: Optional[_AdzunaNamed] = None
+        redirect_url: Optional[str] = None
+        created: Optional[str] = None
+
+    class _AdzunaPage(msgspec.Struct):
+        results: List[_AdzunaItem] = []
+
+    _reed_decoder = msgspec.json.Decoder(_ReedPage)
+    _adzuna_decoder = msgspec.json.Decoder(_AdzunaPage)
+else:
+    _reed_decoder = None
+    _adzuna_decoder = None
+
+
+# --- Reed ------------------------------------------------------------------------
+def reed_jobs_from_items(items: List[Dict]) -> List[Job]:
+    jobs: List[Job] = []
+    append = jobs.append
+    for item in items:
+        get = item.get
+        job_id = get("jobId")
+        title = get("jobTitle")
+        if not job_id or not title:
+            continue
+        append(Job(
+            source="reed",
+            source_job_id=str(job_id),
+            title=title,
+            company=get("employerName"),
+            location=get("locationName"),
+            url=get("jobUrl"),
+            posted_at=parse_reed_date(get("date")),
+        ))
+    return jobs
+
+
+def reed_jobs_from_body(body: bytes) -> List[Job]:
+    if _reed_decoder is None:
+        return reed_jobs_from_items(loads(body).get("results", []))
+
+    return [
+        Job(
+            source="reed",
+            source_job_id=str(it.jobId),
+            title=it.jobTitle,
+            company=it.employerName,
+            location=it.locationName,
+            url=it.jobUrl,
+            posted_at=parse_reed_date(it.date),
+        )
+        for it in _reed_decoder.decode(body).results
+        if it.jobId and it.jobTitle
+    ]
+
+
+# --- Adzuna ----------------------------------------------------------------------
+def adzuna_jobs_from_items(items: List[Dict]) -> List[Job]:
+    jobs: List[Job] = []
+    append = jobs.append
+    for item in items:
+        get = item.get
+        job_id = get("id")
+        title = get("title")
+        if not job_id or not title:
+            continue
+        company = get("company")
+        location = get("location")
+        append(Job(
+            source="adzuna",
+            source_job_id=str(job_id),
+            title=title,
+            company=company.get("display_name") if company else None,
+            location=location.get("display_name") if location else None,
+            url=get("redirect_url"),
+            posted_at=parse_adzuna_date_iso(get("created")),
+        ))
+    return jobs
+
+
+def adzuna_jobs_from_body(body: bytes) -> List[Job]:
+    if _adzuna_decoder is None:
+        return adzuna_jobs_from_items(loads(body).get("results", []))
+
+    return [
+        Job(
+            source="adzuna",
+            source_job_id=str(it.id),
+            title=it.title,
+            company=it.company.display_name if it.company else None,
+            location=it.location.display_name if it.location else None,
+            url=it.redirect_url,
+            posted_at=parse_adzuna_date_iso(it.created),
+        )
+        for it in _adzuna_decoder.decode(body).results
+        if it.id and it.title
+    ]
@@ -1,61 +1,88 @@
-from app.domain.job import Job, parse_reed_date
-from typing import List, Optional, Dict
+from app.domain.job import Job
+from app.sources import payloads
+from app.sources.base import BaseSourceClient, KnownUids, paginate
+from app.sources.cache import ResponseCache
+from typing import Iterator, List, Optional, Dict
+from datetime import datetime
 from fastapi import FastAPI, HTTPException
 import httpx
 
 
-class ReedApiClient:
+class ReedApiClient(BaseSourceClient):
     """
     Raw Reed API client (returns JSON) — good for testing connectivity and auth.
     """
     BASE_URL = "https://www.reed.co.uk/api/1.0"  # no trailing slash
+    MAX_PAGE_SIZE = 100  # Reed caps resultsToTake at 100
+    source = "reed"
 
-    def __init__(self, api_key: str, client: httpx.Client):
+    def __init__(self, api_key: str, client: httpx.Client, cache: Optional[ResponseCache] = None, **resilience):
         self.api_key = api_key
         # Basic Auth: username=api_key, password=""
-        self.client = client
+        super().__init__(client, cache, **resilience)
 
-    def search_raw(self, *, keywords: str, location_name: Optional[str] = None, results_to_take: int = 25) -> Dict:
+    def raise_for_status(self, resp: httpx.Response) -> None:
+        if resp.status_code == 401:
+            raise HTTPException(
+                status_code=401, detail="Reed auth failed. Check REED_API_KEY.")
+        if resp.status_code >= 400:
+            raise HTTPException(
+                status_code=502, detail=f"Reed error {resp.status_code}: {resp.text[:200]}")
+
+    def search_body(self, *, keywords: str, location_name: Optional[str] = None, results_to_take: int = 25, results_to_skip: int = 0) -> bytes:
         params = {
             "keywords": keywords,
             "resultsToTake": results_to_take,
         }
+        if results_to_skip:
+            params["resultsToSkip"] = results_to_skip
         if location_name:
             params["locationName"] = location_name
 
-        resp = self.client.get(f"{self.BASE_URL}/search", params=params)
+        return self.get_body(f"{self.BASE_URL}/search", params)
 
-        if resp.status_code == 401:
-            raise HTTPException(
-                status_code=401, detail="Reed auth failed. Check REED_API_KEY.")
-        if resp.status_code >= 400:
-            raise HTTPException(
-                status_code=502, detail=f"Reed error {resp.status_code}: {resp.text[:200]}")
-        return resp.json()
+    def search_raw(self, *, keywords: str, location_name: Optional[str] = None, results_to_take: int = 25, results_to_skip: int = 0) -> Dict:
+        body = self.search_body(
+            keywords=keywords,
+            location_name=location_name,
+            results_to_take=results_to_take,
+            results_to_skip=results_to_skip,
+        )
+        return payloads.loads(body)
 
-    def search(self, *, keywords: str, location_name: Optional[str] = None, results_to_take: int = 25) -> List[Job]:
-        data = self.search_raw(
+    def search(self, *, keywords: str, location_name: Optional[str] = None, results_to_take: int = 25, results_to_skip: int = 0) -> List[Job]:
+        body = self.search_body(
             keywords=keywords,
             location_name=location_name,
             results_to_take=results_to_take,
+            results_to_skip=results_to_skip,
         )
+        # projection decode: only the fields Job needs (see sources.payloads)
+        return payloads.reed_jobs_from_body(body)
 
-        jobs: List[Job] = []
-        for item in data.get("results", []):
-            job_id = item.get("jobId")
-            title = item.get("jobTitle")
-            if not job_id or not title:
-                continue
-
-            jobs.append(
-                Job(
-                    source="reed",
-                    source_job_id=str(job_id),
-                    title=title,
-                    company=item.get("employerName"),
-                    location=item.get("locationName"),
-                    url=item.get("jobUrl"),
-                    posted_at=parse_reed_date(item.get("date")),
-                )
-            )
-        return jobs
+    def iter_pages(
+        self,
+        *,
+        keywords: str,
+        location_name: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        max_pages: int = 1,
+        known_uids: Optional[KnownUids] = None,
+        posted_cutoff: Optional[datetime] = None,
+    ) -> Iterator[List[Job]]:
+        """
+        Page through results via resultsToSkip, yielding one Job batch per page.
+        See sources.base.paginate for the early-stop rules.
+        """
+        page_size = min(page_size, self.MAX_PAGE_SIZE)
+        return paginate(
+            lambda page_no: self.search(
+                keywords=keywords,
+                location_name=location_name,
+                results_to_take=page_size,
+                results_to_skip=page_no * page_size,
+            ),
+            max_pages=max_pages,
+            known_uids=known_uids,
+            posted_cutoff=posted_cutoff,
+        )
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.sources.cache import make_cache_key
+
+
+def cassette_key(request: httpx.Request) -> str:
+    """
+    Identify a source request by host + path + params, minus credentials
+    (same canonicalization as the response cache).
+    """
+    url = request.url
+    base = f"{url.scheme}://{url.host}{url.path}"
+    return make_cache_key(url.host, base, dict(url.params))
+
+
+def cassette_file(directory: Path, key: str) -> Path:
+    return directory / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """
+    Pass requests through to the real network and save each response
+    (status, content-type, body) as a JSON "cassette" under `directory`.
+    Request headers are never written, so the Reed API key stays out of it.
+    """
+
+    def __init__(self, directory: str, wrapped: Optional[httpx.BaseTransport] = None) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.wrapped = wrapped or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        resp = self.wrapped.handle_request(request)
+        body = resp.read()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        key = cassette_key(request)
+        cassette_file(self.directory, key).write_text(json.dumps({
+            "key": key,
+            "path": f"{request.url.host}{request.url.path}",
+            "status": resp.status_code,
+            "content_type": resp.headers.get("content-type", "application/json"),
+            "elapsed_ms": round(elapsed_ms, 1),
+            "body": body.decode("utf-8", errors="replace"),
+        }))
+
+        # body is decoded already: drop the headers describing the wire bytes,
+        # or the client would try to gunzip it a second time
+        headers = [
+            (k, v) for k, v in resp.headers.multi_items()
+            if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return httpx.Response(
+            resp.status_code, headers=headers, content=body, request=request)
+
+    def close(self) -> None:
+        self.wrapped.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """
+    Serve recorded cassettes instead of calling Reed/Adzuna, with injectable
+    latency and failures so the ingest path can be load-tested offline.
+
+      - latency_ms / jitter_ms: sleep per request (uniform jitter on top);
+        latency_ms < 0 replays each cassette's recorded elapsed time instead.
+      - error_rate: fraction of requests that fail, split between 429
+        (with Retry-After), 503 and a connect timeout.
+      - match="path": when no cassette matches the exact query, serve one
+        recorded for the same endpoint (so arbitrary saved searches still get
+        realistic payloads). match="exact" answers 404 instead.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0.0,
+        match: str = "path",
+        seed: Optional[int] = None,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.match = match
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._by_key: Dict[str, Dict] = {}
+        self._by_path: Dict[str, List[Dict]] = {}
+        for f in sorted(Path(directory).glob("*.json")):
+            cassette = json.loads(f.read_text())
+            self._by_key[cassette["key"]] = cassette
+            self._by_path.setdefault(cassette["path"], []).append(cassette)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = cassette_key(request)
+        cassette = self._by_key.get(key)
+        if cassette is None and self.match == "path":
+            candidates = self._by_path.get(f"{request.url.host}{request.url.path}")
+            if candidates:
+                # stable per query, so repeated runs see the same payload
+                digest = int(hashlib.sha1(key.encode()).hexdigest(), 16)
+                cassette = candidates[digest % len(candidates)]
+
+        with self._lock:
+            roll = self._rng.random()
+            jitter = self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+
+        if self.latency_ms < 0:
+            delay_ms = (cassette or {}).get("elapsed_ms", 0) + jitter
+        else:
+            delay_ms = self.latency_ms + jitter
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+
+        if roll < self.error_rate:
+            kind = int(roll / self.error_rate * 3)
+            if kind == 0:
+                return httpx.Response(429, headers={"Retry-After": "1"}, text="rate limited (replay)", request=request)
+            if kind == 1:
+                return httpx.Response(503, text="unavailable (replay)", request=request)
+            raise httpx.ConnectTimeout("timeout (replay)", request=request)
+
+        if cassette is None:
+            return httpx.Response(404, text=f"no cassette for {key}", request=request)
+
+        return httpx.Response(
+            cassette["status"],
+            headers={"content-type": cassette["content_type"]},
+            content=cassette["body"].encode("utf-8"),
+            request=request,
+        )
+
+
+def make_source_transport() -> Optional[httpx.BaseTransport]:
+    """
+    Transport for the Reed/Adzuna httpx clients, by SOURCE_HTTP_MODE:
+    "live" (default network transport), "record" or "replay".
+    """
+    mode = settings.SOURCE_HTTP_MODE
+    if mode == "live":
+        return None
+    if mode == "record":
+        return RecordingTransport(settings.SOURCE_CASSETTE_DIR)
+    if mode == "replay":
+        return ReplayTransport(
+            settings.SOURCE_CASSETTE_DIR,
+            latency_ms=settings.REPLAY_LATENCY_MS,
+            jitter_ms=settings.REPLAY_JITTER_MS,
+            error_rate=settings.REPLAY_ERROR_RATE,
+            match=settings.REPLAY_MATCH,
+        )
+    raise RuntimeError(f"Unknown SOURCE_HTTP_MODE={mode}")
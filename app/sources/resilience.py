@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+# Upstream responses worth retrying: rate limited or the provider is having a moment.
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate_per_minute` sustained, up to `burst` at once.
+
+    WHY: providers publish per-minute quotas; pacing ourselves is cheaper
+    than finding out via 429s (which also burn quota on some providers).
+    """
+
+    def __init__(self, *, rate_per_minute: float, burst: int) -> None:
+        self.rate_per_sec = rate_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate_per_sec)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate_per_sec
+            time.sleep(wait)
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter; an upstream Retry-After wins when present.
+    """
+
+    def __init__(self, *, max_attempts: int, base_delay: float, max_delay: float) -> None:
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, resp: Optional[httpx.Response] = None) -> float:
+        retry_after = parse_retry_after(resp) if resp is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+
+def parse_retry_after(resp: httpx.Response) -> Optional[float]:
+    """Retry-After is either delta-seconds or an HTTP date."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """
+    closed -> (N consecutive failures) -> open -> (cool-off) -> half-open -> closed/open
+
+    Half-open admits a single probe call; its outcome closes or re-opens the
+    breaker. A probe that never reports back (e.g. its caller crashed) is
+    replaced by a new one after another cool-off.
+
+    WHY: when a provider is down, failing fast for a while beats spending every
+    remaining search's retries (and our request timeout) on it.
+    """
+
+    def __init__(self, *, failure_threshold: int, cooloff_seconds: float) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooloff_seconds = cooloff_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.cooloff_seconds:
+                return "half-open"
+            return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.cooloff_seconds:
+                return False
+            if self._probe_started is not None and now - self._probe_started < self.cooloff_seconds:
+                return False  # a probe is already in flight
+            self._probe_started = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_started = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            half_open = (
+                self._opened_at is not None
+                and time.monotonic() - self._opened_at >= self.cooloff_seconds
+            )
+            if half_open or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probe_started = None
+
+    def release(self) -> None:
+        """
+        The call finished without saying anything about provider health
+        (e.g. a 401/404): leave the state alone, free the half-open probe.
+        """
+        with self._lock:
+            self._probe_started = None
+
+
+def make_source_resilience(source: str) -> Dict:
+    """
+    limiter/retry/breaker kwargs for a source client, from Settings
+    (<SOURCE>_RATE_PER_MINUTE / <SOURCE>_RATE_BURST + shared SOURCE_* knobs).
+    """
+    prefix = source.upper()
+    return {
+        "limiter": TokenBucket(
+            rate_per_minute=getattr(settings, f"{prefix}_RATE_PER_MINUTE"),
+            burst=getattr(settings, f"{prefix}_RATE_BURST"),
+        ),
+        "retry": RetryPolicy(
+            max_attempts=settings.SOURCE_RETRY_ATTEMPTS,
+            base_delay=settings.SOURCE_RETRY_BASE_SECONDS,
+            max_delay=settings.SOURCE_RETRY_MAX_SECONDS,
+        ),
+        "breaker": CircuitBreaker(
+            failure_threshold=settings.SOURCE_BREAKER_FAILURES,
+            cooloff_seconds=settings.SOURCE_BREAKER_COOLOFF_SECONDS,
+        ),
+    }
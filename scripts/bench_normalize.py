@@ -0,0 +1,126 @@
+"""
+Microbenchmark: normalizing a 100-item Reed/Adzuna page into Job objects.
+
+  python -m scripts.bench_normalize
+
+"legacy" is the pre-optimization path (json.loads + nested .get + strptime per
+item); "fast" is app.sources.payloads (msgspec projection or orjson when
+installed, hand-rolled + cached date parsing).
+"""
+import json
+import random
+import timeit
+from datetime import datetime
+from typing import Dict, List
+
+from app.domain.job import Job
+from app.sources import payloads
+
+ITEMS = 100
+RUNS = 2000
+
+LOREM = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+
+
+def reed_page() -> bytes:
+    results = []
+    for i in range(ITEMS):
+        results.append({
+            "jobId": 50000000 + i,
+            "employerId": 1234,
+            "employerName": f"Employer {i % 17}",
+            "employerProfileId": None,
+            "employerProfileName": None,
+            "jobTitle": f"Backend Engineer {i}",
+            "locationName": random.choice(["London", "Manchester", "Leeds"]),
+            "minimumSalary": 50000.0,
+            "maximumSalary": 70000.0,
+            "currency": "GBP",
+            "expirationDate": "01/03/2026",
+            "date": f"{1 + i % 28:02d}/01/2026",
+            "jobDescription": LOREM,
+            "applications": 12,
+            "jobUrl": f"https://www.reed.co.uk/jobs/backend-engineer/{50000000 + i}",
+        })
+    return json.dumps({"results": results, "totalResults": 5000}).encode()
+
+
+def adzuna_page() -> bytes:
+    results = []
+    for i in range(ITEMS):
+        results.append({
+            "id": str(4000000000 + i),
+            "title": f"Cloud Engineer {i}",
+            "description": LOREM,
+            "created": f"2026-01-{1 + i % 28:02d}T{i % 24:02d}:15:00Z",
+            "redirect_url": f"https://www.adzuna.co.uk/jobs/land/ad/{4000000000 + i}",
+            "company": {"display_name": f"Company {i % 13}", "__CLASS__": "Adzuna::API::Response::Company"},
+            "location": {"display_name": "London, UK", "area": ["UK", "London"], "__CLASS__": "Adzuna::API::Response::Location"},
+            "category": {"label": "IT Jobs", "tag": "it-jobs"},
+            "salary_min": 60000, "salary_max": 80000, "salary_is_predicted": "0",
+            "latitude": 51.5, "longitude": -0.12, "contract_time": "full_time",
+        })
+    return json.dumps({"results": results, "count": 5000}).encode()
+
+
+def legacy_reed(body: bytes) -> List[Job]:
+    data: Dict = json.loads(body)
+    jobs = []
+    for item in data.get("results", []):
+        job_id = item.get("jobId")
+        title = item.get("jobTitle")
+        if not job_id or not title:
+            continue
+        date = item.get("date")
+        jobs.append(Job(
+            source="reed", source_job_id=str(job_id), title=title,
+            company=item.get("employerName"), location=item.get("locationName"),
+            url=item.get("jobUrl"),
+            posted_at=datetime.strptime(date, "%d/%m/%Y") if date else None,
+        ))
+    return jobs
+
+
+def legacy_adzuna(body: bytes) -> List[Job]:
+    data: Dict = json.loads(body)
+    jobs = []
+    for item in data.get("results", []):
+        job_id = item.get("id")
+        title = item.get("title")
+        if not job_id or not title:
+            continue
+        created = item.get("created")
+        jobs.append(Job(
+            source="adzuna", source_job_id=str(job_id), title=title,
+            company=(item.get("company") or {}).get("display_name"),
+            location=(item.get("location") or {}).get("display_name"),
+            url=item.get("redirect_url"),
+            posted_at=datetime.strptime(created, "%Y-%m-%dT%H:%M:%SZ") if created else None,
+        ))
+    return jobs
+
+
+def bench(label: str, fn, body: bytes) -> float:
+    best = min(timeit.repeat(lambda: fn(body), number=RUNS, repeat=3)) / RUNS
+    print(f"  {label:<8} {best * 1e6:9.1f} us/page")
+    return best
+
+
+def main() -> None:
+    decoder = "msgspec" if payloads.msgspec else (
+        "orjson" if payloads.orjson else "json")
+    print(f"{ITEMS} items/page, fast decoder: {decoder}")
+
+    for name, body, legacy, fast in [
+        ("reed", reed_page(), legacy_reed, payloads.reed_jobs_from_body),
+        ("adzuna", adzuna_page(), legacy_adzuna, payloads.adzuna_jobs_from_body),
+    ]:
+        assert legacy(body) == fast(body), "fast path must produce the same Jobs"
+        print(name)
+        slow = bench("legacy", legacy, body)
+        quick = bench("fast", fast, body)
+        print(f"  speedup  {slow / quick:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
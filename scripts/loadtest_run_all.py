@@ -0,0 +1,61 @@
+"""
+End-to-end load test for /tasks/run-all against a local server.
+
+Record once with real keys, then replay offline as often as you like:
+
+  SOURCE_HTTP_MODE=record uvicorn app.main:app          # hit /ingest/* or /tasks/* a few times
+  SOURCE_HTTP_MODE=replay REPLAY_LATENCY_MS=-1 REPLAY_ERROR_RATE=0.02 \\
+  SOURCE_CACHE_BACKEND=none uvicorn app.main:app
+  python -m scripts.loadtest_run_all --searches 200 --runs 3
+
+REPLAY_LATENCY_MS=-1 replays the recorded upstream timings. Disable the
+response cache (SOURCE_CACHE_BACKEND=none) so repeat runs pay replay latency.
+"""
+import argparse
+import os
+import random
+import time
+
+import httpx
+
+WORDS = [
+    "python", "backend", "cloud", "devops", "typescript", "node", "aws", "terraform",
+    "data", "platform", "golang", "java", "kubernetes", "sre", "django", "fastapi",
+]
+LOCATIONS = [None, "London", "Manchester", "Leeds", "Bristol", "Remote"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default=os.getenv("BASE_URL", "http://127.0.0.1:8000"))
+    parser.add_argument("--cron-secret", default=os.getenv("CRON_SECRET", ""))
+    parser.add_argument("--searches", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with httpx.Client(base_url=args.base_url, timeout=None) as client:
+        for i in range(args.searches):
+            client.post("/searches", json={
+                "name": f"loadtest-{i:04d}",
+                "q": " ".join(rng.sample(WORDS, rng.randint(1, 2))),
+                "location": rng.choice(LOCATIONS),
+            }).raise_for_status()
+        print(f"seeded {args.searches} saved searches")
+
+        for run in range(1, args.runs + 1):
+            start = time.perf_counter()
+            resp = client.post("/tasks/run-all", headers={"X-CRON-SECRET": args.cron_secret})
+            elapsed = time.perf_counter() - start
+            resp.raise_for_status()
+            data = resp.json()
+            errors = sum(1 for r in data["results"] if r.get("errors"))
+            print(
+                f"run {run}: {elapsed:6.2f}s  searches={data['ran']} "
+                f"upstream_queries={data.get('upstream_queries')} with_errors={errors}"
+            )
+
+
+if __name__ == "__main__":
+    main()
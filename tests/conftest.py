@@ -0,0 +1,30 @@
+import itertools
+import os
+
+import pytest
+
+# Settings() needs these at import time; tests never talk to real services.
+for name, value in {
+    "REED_API_KEY": "test-reed-key",
+    "ADZUNA_APP_ID": "test-adzuna-id",
+    "ADZUNA_APP_KEY": "test-adzuna-key",
+    "DATABASE_URL": "postgresql+psycopg://test@localhost/test",
+    "CRON_SECRET": "test-cron-secret",
+    "EMAIL_FROM": "from@example.com",
+    "EMAIL_TO": "to@example.com",
+}.items():
+    os.environ.setdefault(name, value)
+
+
+@pytest.fixture
+def search():
+    """Factory for unsaved SavedSearchRow objects (ids handed out in order)."""
+    from app.db_models import SavedSearchRow  # after the env defaults above
+
+    ids = itertools.count(1)
+
+    def make(name, q=None, source=None, location=None, posted_after=None, limit=50):
+        return SavedSearchRow(name=name, id=next(ids), q=q, source=source,
+                              location=location, posted_after=posted_after, limit=limit)
+
+    return make
@@ -0,0 +1,40 @@
+import base64
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.job_repo_db import FeedKey, decode_cursor, encode_cursor
+
+
+def row(posted_at, created_at, uid):
+    return SimpleNamespace(posted_at=posted_at, created_at=created_at, uid=uid)
+
+
+def test_round_trip():
+    r = row(datetime(2026, 3, 1), datetime(2026, 3, 2, 9, 30, 15, 123456), "reed:42")
+    assert decode_cursor(encode_cursor(r)) == FeedKey(r.posted_at, r.created_at, r.uid)
+
+
+def test_round_trip_without_posted_at():
+    r = row(None, datetime(2026, 3, 2), "adzuna:7")
+    assert decode_cursor(encode_cursor(r)) == FeedKey(None, r.created_at, "adzuna:7")
+
+
+def test_cursor_is_url_safe_and_unpadded():
+    cursor = encode_cursor(row(datetime(2026, 3, 1), datetime(2026, 3, 2), "reed:?>/+"))
+    assert "=" not in cursor
+    assert "+" not in cursor and "/" not in cursor
+
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "not a cursor!",
+    base64.urlsafe_b64encode(b"{}").decode(),
+    base64.urlsafe_b64encode(b"[1,2]").decode(),
+    base64.urlsafe_b64encode(b'[null,"yesterday","reed:1"]').decode(),
+    base64.urlsafe_b64encode(b'[null,null,"reed:1"]').decode(),
+])
+def test_garbage_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
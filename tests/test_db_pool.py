@@ -0,0 +1,18 @@
+from app.core.config import settings
+from app.db_pool import engine_options
+
+
+def test_async_psycopg_never_prepares(monkeypatch):
+    monkeypatch.setattr(settings, "DB_PGBOUNCER", False)
+    url = "postgresql+psycopg://u@h/db"
+    assert engine_options(url, is_async=True)["connect_args"] == {"prepare_threshold": None}
+    assert engine_options(url)["connect_args"] == {}
+
+
+def test_pgbouncer_turns_off_prepares_everywhere(monkeypatch):
+    monkeypatch.setattr(settings, "DB_PGBOUNCER", True)
+    assert engine_options("postgresql+psycopg://u@h/db")["connect_args"] == {
+        "prepare_threshold": None}
+    assert engine_options("postgresql+asyncpg://u@h/db", is_async=True)["connect_args"] == {
+        "statement_cache_size": 0, "prepared_statement_cache_size": 0}
+    assert engine_options("postgresql+psycopg2://u@h/db")["connect_args"] == {}
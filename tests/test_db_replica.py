@@ -0,0 +1,46 @@
+import asyncio
+
+from sqlalchemy import create_engine, exc
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+from app.db_replica import ReplicaLag, replica_usable, replica_usable_async
+
+CHECKOUT_TIMEOUT = exc.TimeoutError("QueuePool limit of size 5 overflow 10 reached")
+
+
+class TimingOutAsyncSession:
+    async def execute(self, *args, **kwargs):
+        raise CHECKOUT_TIMEOUT
+
+
+def test_checkout_timeout_falls_back_to_primary():
+    # a replica pool with its only connection taken: checkout times out
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1,
+                           max_overflow=0, pool_timeout=0.01)
+    lag = ReplicaLag(max_lag_seconds=10, check_seconds=5)
+    with engine.connect(), Session(engine) as replica:
+        assert replica_usable(replica, lag, None) is False
+    assert lag.checked_at is not None and not lag.healthy()
+    engine.dispose()
+
+
+def test_checkout_timeout_falls_back_to_primary_async():
+    lag = ReplicaLag(max_lag_seconds=10, check_seconds=5)
+    assert asyncio.run(replica_usable_async(TimingOutAsyncSession(), lag, None)) is False
+    assert lag.checked_at is not None and not lag.healthy()
+
+
+def test_healthy_replica_checks_the_clients_last_write():
+    class Replica:
+        def __init__(self, *results):
+            self.results = list(results)
+
+        def execute(self, *args, **kwargs):
+            value = self.results.pop(0)
+            return type("Result", (), {"scalar_one": lambda self: value})()
+
+    lag = ReplicaLag(max_lag_seconds=10, check_seconds=5)
+    assert replica_usable(Replica(0.5, False), lag, "0/16B3748") is False
+    assert lag.healthy()
+    assert replica_usable(Replica(True), lag, "0/16B3748") is True  # lag still fresh
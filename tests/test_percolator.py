@@ -0,0 +1,66 @@
+import random
+from datetime import date, datetime
+
+from app.domain.job import Job
+from app.services import query_planner
+from app.services.percolator import Percolator, _grams
+
+WORDS = ["python", "node.js", "go", "data", "engineer", "senior", "backend", "ml", "devops"]
+PLACES = ["London", "Leeds", "Remote", None]
+
+
+def random_jobs(rng, n):
+    return [
+        Job(
+            source=rng.choice(["reed", "adzuna"]),
+            source_job_id=str(i),
+            title=" ".join(rng.sample(WORDS, 3)),
+            company=rng.choice(["Acme", "Initech", None]),
+            location=rng.choice(PLACES),
+            posted_at=rng.choice([None, datetime(2026, 1, rng.randint(1, 28))]),
+        )
+        for i in range(n)
+    ]
+
+
+def test_grams_are_all_substrings_up_to_three_chars():
+    assert _grams("node") == {"n", "o", "d", "e", "no", "od", "de", "nod", "ode"}
+    assert _grams("") == set()
+
+
+def test_percolate_agrees_with_jobs_for_search(search):
+    rng = random.Random(7)
+    searches = [
+        search("py", q="python"),
+        search("node-london", q="Node engineer", location="london"),
+        search("reed-go", q="go", source="Reed"),
+        search("adzuna-any", source="adzuna"),  # unanchored, per source
+        search("everything"),  # unanchored, any source
+        search("recent-data", q="data", posted_after=date(2026, 1, 15)),
+        search("top3-remote", location="remote", limit=3),
+        search("ml-leeds", q="ML", location="Leeds", limit=1),
+    ]
+    jobs = random_jobs(rng, 300)
+
+    found = Percolator(searches).percolate(jobs)
+
+    for s in searches:
+        expected = query_planner.jobs_for_search(jobs, s)
+        assert found.get(s.name, []) == expected, s.name
+
+
+def test_percolate_caps_each_search_to_its_newest_limit(search):
+    jobs = [Job("reed", str(d), "python dev", posted_at=datetime(2026, 2, d)) for d in range(1, 6)]
+    found = Percolator([search("py", q="python", limit=2)]).percolate(jobs)
+    assert [j.source_job_id for j in found["py"]] == ["5", "4"]
+
+
+def test_search_source_filters_candidates(search):
+    p = Percolator([search("reed-py", q="python", source="reed")])
+    assert p.match(Job("adzuna", "1", "Python developer")) == []
+    assert [s.name for s in p.match(Job("reed", "1", "Python developer"))] == ["reed-py"]
+
+
+def test_searches_are_kept_by_name(search):
+    s = search("py", q="python")
+    assert Percolator([s]).searches == {"py": s}
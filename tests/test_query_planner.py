@@ -0,0 +1,55 @@
+from datetime import date, datetime
+
+from app.domain.job import Job
+from app.services.query_planner import (
+    PlannedQuery, UpstreamQuery, jobs_for_search, plan_queries, upstream_query_for,
+)
+
+
+def test_upstream_query_is_normalized(search):
+    s = search("a", q="  Python   Engineer ", location=" London ")
+    assert upstream_query_for(s) == UpstreamQuery(q="python engineer", location="london")
+
+
+def test_plan_groups_searches_by_upstream_query(search):
+    a = search("a", q="Python", location="London", source="reed")
+    b = search("b", q="python", location="london", posted_after=date(2026, 1, 1))
+    c = search("c", q="python")
+    plan = plan_queries([a, b, c])
+
+    assert [p.query for p in plan] == [
+        UpstreamQuery("python", "london"), UpstreamQuery("python", None)]
+    assert [[s.name for s in p.searches] for p in plan] == [["a", "b"], ["c"]]
+
+
+def test_group_sources_are_the_loosest(search):
+    q = UpstreamQuery("python")
+    assert PlannedQuery(q, [search("a", source="Reed")]).sources == ["reed"]
+    assert PlannedQuery(q, [search("a", source="adzuna"), search("b", source="reed")]).sources == [
+        "reed", "adzuna"]
+    assert PlannedQuery(q, [search("a", source="reed"), search("b")]).sources == ["reed", "adzuna"]
+
+
+def test_group_posted_after_and_limit_are_the_loosest(search):
+    q = UpstreamQuery("python")
+    early = search("a", posted_after=date(2026, 1, 1), limit=10)
+    late = search("b", posted_after=date(2026, 2, 1), limit=30)
+    assert PlannedQuery(q, [early, late]).posted_after == date(2026, 1, 1)
+    assert PlannedQuery(q, [early, late, search("c", limit=5)]).posted_after is None
+    assert PlannedQuery(q, [early, late]).limit == 30
+
+
+def test_jobs_for_search_filters_sorts_and_limits(search):
+    jobs = [
+        Job("reed", "1", "Python dev", location="London", posted_at=datetime(2026, 1, 5)),
+        Job("reed", "2", "Python dev", location="Leeds", posted_at=datetime(2026, 1, 9)),
+        Job("adzuna", "3", "Senior python", location="London", posted_at=datetime(2026, 1, 7)),
+        Job("reed", "4", "Go dev", location="London", posted_at=datetime(2026, 1, 8)),
+        Job("reed", "5", "python", location="London", posted_at=None),
+        Job("reed", "6", "Python lead", location="London", posted_at=datetime(2026, 1, 6)),
+    ]
+    s = search("a", q="python", location="london", limit=3)
+    assert [j.source_job_id for j in jobs_for_search(jobs, s)] == ["3", "6", "1"]
+
+    pinned = search("b", q="python", source="reed", posted_after=date(2026, 1, 6))
+    assert [j.source_job_id for j in jobs_for_search(jobs, pinned)] == ["2", "6"]
@@ -0,0 +1,69 @@
+import gzip
+import json
+
+import httpx
+
+from app.sources.replay import RecordingTransport, ReplayTransport
+
+PAYLOAD = {"results": [{"jobId": 1, "jobTitle": "python engineer", "locationName": "Londön"}]}
+
+
+def gzip_upstream(request: httpx.Request) -> httpx.Response:
+    body = gzip.compress(json.dumps(PAYLOAD).encode("utf-8"))
+    return httpx.Response(200, headers={
+        "content-type": "application/json",
+        "content-encoding": "gzip",
+        "content-length": str(len(body)),
+    }, content=body)
+
+
+def test_recording_gzip_upstream_is_decoded_once(tmp_path):
+    transport = RecordingTransport(str(tmp_path), wrapped=httpx.MockTransport(gzip_upstream))
+    with httpx.Client(transport=transport) as client:
+        resp = client.get("https://www.reed.co.uk/api/1.0/search", params={"keywords": "python"})
+
+    assert resp.status_code == 200
+    assert resp.json() == PAYLOAD
+    assert "content-encoding" not in resp.headers
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_replay_serves_recorded_gzip_cassette(tmp_path):
+    recorder = RecordingTransport(str(tmp_path), wrapped=httpx.MockTransport(gzip_upstream))
+    with httpx.Client(transport=recorder) as client:
+        client.get("https://www.reed.co.uk/api/1.0/search", params={"keywords": "python"})
+
+    with httpx.Client(transport=ReplayTransport(str(tmp_path))) as client:
+        resp = client.get("https://www.reed.co.uk/api/1.0/search", params={"keywords": "python"})
+    assert resp.status_code == 200
+    assert resp.json() == PAYLOAD
+
+
+def test_replay_matching_exact_vs_path(tmp_path):
+    recorder = RecordingTransport(str(tmp_path), wrapped=httpx.MockTransport(gzip_upstream))
+    with httpx.Client(transport=recorder) as client:
+        client.get("https://www.reed.co.uk/api/1.0/search", params={"keywords": "python"})
+
+    url = "https://www.reed.co.uk/api/1.0/search"
+    with httpx.Client(transport=ReplayTransport(str(tmp_path), match="exact")) as client:
+        assert client.get(url, params={"keywords": "golang"}).status_code == 404
+    with httpx.Client(transport=ReplayTransport(str(tmp_path), match="path")) as client:
+        assert client.get(url, params={"keywords": "golang"}).json() == PAYLOAD
+
+
+def test_replay_injects_errors(tmp_path):
+    recorder = RecordingTransport(str(tmp_path), wrapped=httpx.MockTransport(gzip_upstream))
+    url = "https://www.reed.co.uk/api/1.0/search"
+    with httpx.Client(transport=recorder) as client:
+        client.get(url)
+
+    transport = ReplayTransport(str(tmp_path), error_rate=1.0, seed=1)
+    seen = set()
+    with httpx.Client(transport=transport) as client:
+        for _ in range(30):
+            try:
+                seen.add(client.get(url).status_code)
+            except httpx.ConnectTimeout:
+                seen.add("timeout")
+    assert seen <= {429, 503, "timeout"}
+    assert len(seen) > 1
@@ -0,0 +1,160 @@
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.sources import base, resilience
+from app.sources.base import BaseSourceClient
+from app.sources.resilience import CircuitBreaker, RetryPolicy, parse_retry_after
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = Clock()
+    monkeypatch.setattr(resilience.time, "monotonic", c)
+    return c
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(base.time, "sleep", lambda s: None)
+
+
+def open_breaker(clock, threshold=2, cooloff=30):
+    breaker = CircuitBreaker(failure_threshold=threshold, cooloff_seconds=cooloff)
+    for _ in range(threshold):
+        breaker.record_failure()
+    return breaker
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, cooloff_seconds=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_half_open_admits_a_single_probe(clock):
+    breaker = open_breaker(clock)
+    clock.now += 30
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+    assert not breaker.allow()
+    assert not breaker.allow()
+
+
+def test_probe_success_closes_and_failure_reopens(clock):
+    breaker = open_breaker(clock)
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+    breaker = open_breaker(clock)
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+
+def test_released_probe_lets_the_next_call_probe(clock):
+    breaker = open_breaker(clock)
+    clock.now += 30
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+
+
+def test_abandoned_probe_is_replaced_after_cooloff(clock):
+    breaker = open_breaker(clock)
+    clock.now += 30
+    assert breaker.allow()
+    clock.now += 29
+    assert not breaker.allow()
+    clock.now += 1
+    assert breaker.allow()
+
+
+class Client(BaseSourceClient):
+    source = "test"
+
+    def raise_for_status(self, resp: httpx.Response) -> None:
+        pass
+
+
+def make_client(statuses, breaker=None, attempts=3):
+    seen = []
+
+    def handler(request):
+        status = statuses[min(len(seen), len(statuses) - 1)]
+        seen.append(status)
+        return httpx.Response(status, json={})
+
+    client = Client(
+        httpx.Client(transport=httpx.MockTransport(handler)),
+        retry=RetryPolicy(max_attempts=attempts, base_delay=0, max_delay=0),
+        breaker=breaker,
+    )
+    return client, seen
+
+
+def test_retries_retryable_statuses_then_succeeds(clock):
+    client, seen = make_client([503, 429, 200])
+    assert client.send_with_retries("https://x.test/a", {}).status_code == 200
+    assert seen == [503, 429, 200]
+
+
+def test_non_retryable_status_is_returned_without_retry(clock):
+    client, seen = make_client([404])
+    assert client.send_with_retries("https://x.test/a", {}).status_code == 404
+    assert seen == [404]
+
+
+def test_auth_failure_does_not_reset_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=3, cooloff_seconds=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    client, _ = make_client([401], breaker=breaker, attempts=1)
+    client.send_with_retries("https://x.test/a", {})
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_auth_failure_does_not_close_half_open_breaker(clock):
+    breaker = open_breaker(clock)
+    clock.now += 30
+    client, _ = make_client([401], breaker=breaker, attempts=1)
+    client.send_with_retries("https://x.test/a", {})
+    assert breaker.state == "half-open"
+
+
+def test_open_breaker_fails_fast(clock):
+    breaker = open_breaker(clock)
+    client, seen = make_client([200], breaker=breaker)
+    with pytest.raises(HTTPException) as e:
+        client.send_with_retries("https://x.test/a", {})
+    assert e.value.status_code == 503
+    assert seen == []
+
+
+def test_parse_retry_after_seconds_and_missing():
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "7"})) == 7.0
+    assert parse_retry_after(httpx.Response(429)) is None
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+
+
+def test_retry_delay_prefers_retry_after_capped():
+    policy = RetryPolicy(max_attempts=3, base_delay=1, max_delay=5)
+    assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "60"})) == 5
+    assert 0 <= policy.delay(3) <= 4
@@ -0,0 +1,108 @@
+import os
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import exc, text
+
+from app.core.config import settings
+from app.db import make_engine, make_session_factory
+from app.db_models import JobRow, SavedSearchRow, SeenJobRow
+from app.services import saved_search_repo_db
+from app.services.seen_partitions_db import (
+    CREATE_LOCK_STMT, PARENT, add_months, ensure_partitions, expired_partitions, month_start, partition_name,
+    prune_partitions, reportable_since,
+)
+
+
+def test_add_months_rolls_over_years():
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_partition_name():
+    assert partition_name(date(2026, 3, 1)) == "seen_jobs_p202603"
+
+
+def test_expired_partitions_only_whole_months_past_cutoff():
+    parts = {date(2026, m, 1): partition_name(date(2026, m, 1)) for m in (1, 2, 3, 4)}
+    # cutoff 2026-03-02: January and February have fully ended before it
+    now = datetime(2026, 4, 1)
+    assert expired_partitions(parts, retention_days=30, now=now) == [
+        "seen_jobs_p202601", "seen_jobs_p202602"]
+    assert expired_partitions(parts, retention_days=0, now=now) == []
+
+
+def test_reportable_since_never_reaches_into_expired_months():
+    now = datetime(2026, 4, 1)
+    since = reportable_since(30, now=now)
+    month = month_start(since.date())
+    parts = {month: partition_name(month)}
+    assert expired_partitions(parts, retention_days=30, now=now) == []
+    assert reportable_since(0, now=now) is None
+
+
+# The rest needs a migrated Postgres it may wipe: TEST_DATABASE_URL.
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+@pytest.fixture
+def sessions():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL not set")
+    engine = make_engine(TEST_DATABASE_URL)
+    yield make_session_factory(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(sessions):
+    with sessions() as session:
+        session.execute(text("TRUNCATE seen_jobs, saved_searches, jobs, job_counts"))
+        session.commit()
+        yield session
+
+
+def test_ensure_partitions_waits_for_a_concurrent_creator(db, sessions):
+    next_month = add_months(month_start(datetime.utcnow().date()), 1)
+    name = partition_name(next_month)
+    db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    db.commit()
+
+    with sessions() as other:
+        other.execute(CREATE_LOCK_STMT, {"parent": PARENT})  # mid-creation elsewhere
+        with pytest.raises(exc.OperationalError):  # lock_timeout, not a catalog clash
+            ensure_partitions(db, ahead=1)
+        db.rollback()
+        other.rollback()
+
+    assert ensure_partitions(db, ahead=1) == [name]
+    assert ensure_partitions(db, ahead=1) == []
+
+
+def test_pruned_month_does_not_resurface_old_jobs(db, monkeypatch):
+    monkeypatch.setattr(settings, "SEEN_RETENTION_DAYS", 180)
+    now = datetime.utcnow()
+    long_ago = now - timedelta(days=400)
+
+    search = SavedSearchRow(name="py", q="python", limit=10)
+    old = JobRow(uid="reed:1", source="reed", source_job_id="1", title="Python dev",
+                 created_at=long_ago)
+    db.add_all([search, old])
+    db.commit()
+
+    # reported back then, in a month retention has since dropped
+    ensure_partitions(db, ahead=0, now=long_ago)
+    db.add(SeenJobRow(search_id=search.id, job_id=old.id, seen_at=long_ago))
+    db.commit()
+    assert partition_name(month_start(long_ago.date())) in prune_partitions(
+        db, retention_days=180)
+    ensure_partitions(db, ahead=0)
+
+    # still the search's top match, but neither path reports it again
+    assert saved_search_repo_db.new_jobs_for_search(db, "py")[1] == []
+    assert saved_search_repo_db.record_seen_pairs(db, [(search.id, old.id)]) == set()
+
+    fresh = JobRow(uid="reed:2", source="reed", source_job_id="2", title="Python lead")
+    db.add(fresh)
+    db.commit()
+    assert [j.uid for j in saved_search_repo_db.new_jobs_for_search(db, "py")[1]] == ["reed:2"]